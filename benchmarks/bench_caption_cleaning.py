@@ -0,0 +1,57 @@
+"""
+Benchmark clean_caption (per row) vs clean_caption_column (vectorized).
+
+    python -m benchmarks.bench_caption_cleaning --n 100000
+"""
+import time
+import random
+import argparse
+import pandas as pd
+
+from src.cleaning.video_cleaning import clean_caption, clean_caption_column, get_stem_cache
+
+WORDS = ["makanan", "enak", "banget", "yang", "di", "jalan", "murah", "meriah", "kuliner", "pedas",
+         "review", "jujur", "coba", "resep", "masak", "rumah", "viral", "hari", "ini", "beli",
+         "skincare", "kulit", "wajah", "glowing", "serum", "toner", "dong", "nih", "yg", "ke"]
+HASHTAGS = ["#fyp", "#foryou", "#kuliner", "#viral", "#skincare", "#mbg", "#ruu", "#xyzbca"]
+EMOJIS = ["😀", "🔥", "😍", "👍🏽", "🇮🇩", "👨‍👩‍👧"]
+
+def make_captions(n, seed=42):
+    rng = random.Random(seed)
+    captions = []
+    for _ in range(n):
+        parts = rng.choices(WORDS, k=rng.randint(3, 15))
+        parts += rng.choices(HASHTAGS, k=rng.randint(0, 6))
+        parts += rng.choices(EMOJIS, k=rng.randint(0, 3))
+        if rng.random() < 0.05:
+            parts.append("https://vt.tiktok.com/" + str(rng.randint(0, 10**6)))
+        rng.shuffle(parts)
+        captions.append(" ".join(parts).capitalize())
+    return pd.Series(captions)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=100_000)
+    parser.add_argument("--baseline-n", type=int, default=10_000,
+                        help="jumlah caption untuk baseline per-row (lambat)")
+    args = parser.parse_args()
+
+    captions = make_captions(args.n)
+
+    base = captions.head(args.baseline_n)
+    t0 = time.perf_counter()
+    ref = base.apply(clean_caption)
+    t_row = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    out = clean_caption_column(captions)
+    t_vec = time.perf_counter() - t0
+
+    assert (ref.astype(object).values == out.head(args.baseline_n).values).all(), "output berbeda"
+
+    print(f"per-row    : {len(base):>8} captions  {t_row:8.2f}s  {len(base) / t_row:>10.0f} captions/s")
+    print(f"vectorized : {len(captions):>8} captions  {t_vec:8.2f}s  {len(captions) / t_vec:>10.0f} captions/s")
+    print(f"stem cache : {get_stem_cache().stats()}")
+
+if __name__ == "__main__":
+    main()
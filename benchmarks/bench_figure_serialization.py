@@ -0,0 +1,59 @@
+"""
+Benchmark figure time series: list Python + go.Scatter + encoder json (cara lama)
+vs array + optimize_figure (typed array, Scattergl) + orjson.
+
+    python -m benchmarks.bench_figure_serialization --sizes 10000 100000 1000000
+"""
+import time
+import argparse
+import numpy as np
+import pandas as pd
+
+from plotly import graph_objects as go
+from plotly import io as pio
+
+from src.anlysis.render import optimize_figure, figure_to_json, JSON_ENGINE
+
+def make_series(n, seed=42):
+    rng = np.random.default_rng(seed)
+    times = pd.date_range("2020-01-01", periods=n, freq="min", tz="UTC")
+    values = rng.poisson(20, n)
+    return times, values
+
+def baseline_figure(times, values):
+    # cara lama: data list Python, trace SVG
+    return go.Figure(go.Scatter(x=list(times), y=values.tolist(), name="Likes"))
+
+def optimized_figure(times, values):
+    # cara baru: data tetap array/Series, lalu optimize_figure
+    return optimize_figure(go.Figure(go.Scatter(x=pd.Series(times), y=values, name="Likes")))
+
+def timed(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"json engine optimized: {JSON_ENGINE}")
+    print(f"{'points':>9} {'mode':>10} {'build s':>9} {'serialize s':>12} {'payload MB':>11} {'trace':>10}")
+    for n in args.sizes:
+        times, values = make_series(n)
+
+        t_build, fig = timed(lambda: baseline_figure(times, values), 1)
+        t_ser, payload = timed(lambda: pio.to_json(fig, validate=False, engine="json"), args.repeat)
+        print(f"{n:>9} {'baseline':>10} {t_build:>9.3f} {t_ser:>12.3f} {len(payload) / 1e6:>11.2f} {fig.data[0].type:>10}")
+
+        t_build, opt = timed(lambda: optimized_figure(times, values), 1)
+        t_ser, payload = timed(lambda: figure_to_json(opt), args.repeat)
+        print(f"{n:>9} {'optimized':>10} {t_build:>9.3f} {t_ser:>12.3f} {len(payload) / 1e6:>11.2f} {opt.data[0].type:>10}")
+
+if __name__ == "__main__":
+    main()
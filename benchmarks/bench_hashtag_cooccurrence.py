@@ -0,0 +1,56 @@
+"""
+Benchmark co-occurrence hashtag: combinations + Counter (cara lama) vs
+matriks incidence sparse video x hashtag (XᵀX) + ukuran asosiasi + top-N dengan argpartition.
+
+    python -m benchmarks.bench_hashtag_cooccurrence --videos 100000 --top 30 --rank-by npmi --min-support 5
+"""
+import time
+import argparse
+import numpy as np
+import pandas as pd
+
+from src.anlysis.keyword_hashtag import count_hashtag_pairs
+from src.anlysis.association import association_measures
+from src.anlysis.cooccurrence import incidence_matrix, cooccurrence_matrix, top_pairs
+
+def make_hashtags(n_videos, n_tags=20_000, max_tags=15, seed=42):
+    # distribusi hashtag zipf-like: sedikit hashtag sangat populer, banyak yang jarang
+    rng = np.random.default_rng(seed)
+    vocab = np.array([f"tag{i}" for i in range(n_tags)], dtype=object)
+    weights = 1 / np.arange(1, n_tags + 1) ** 1.1
+    lengths = rng.integers(0, max_tags + 1, n_videos)
+    flat = rng.choice(vocab, size=lengths.sum(), p=weights / weights.sum())
+    return pd.Series([list(chunk) for chunk in np.split(flat, np.cumsum(lengths)[:-1])])
+
+def timed(func):
+    t0 = time.perf_counter()
+    result = func()
+    return time.perf_counter() - t0, result
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--videos", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--top", type=int, default=30)
+    parser.add_argument("--rank-by", default="count")
+    parser.add_argument("--min-support", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'videos':>8} {'baseline s':>11} {'incidence s':>12} {'XᵀX s':>8} {'score s':>8} {'sparse s':>9} {'pairs':>10} {'same':>5}")
+    for n in args.videos:
+        tags = make_hashtags(n)
+
+        t_base, expected = timed(lambda: count_hashtag_pairs(tags, args.top, args.rank_by, args.min_support))
+        t_inc, (X, vocab, support) = timed(lambda: incidence_matrix(tags, args.min_support))
+        t_mat, C = timed(lambda: cooccurrence_matrix(X, args.min_support))
+        t_top, result = timed(lambda: top_pairs(
+            C, vocab, args.top,
+            association_measures(C.data, support[C.row], support[C.col], X.shape[0]),
+            args.rank_by
+        ))
+        total = t_inc + t_mat + t_top
+
+        print(f"{n:>8} {t_base:>11.3f} {t_inc:>12.3f} {t_mat:>8.3f} {t_top:>8.3f} {total:>9.3f} "
+              f"{C.nnz:>10} {str(result.equals(expected)):>5}")
+
+if __name__ == "__main__":
+    main()
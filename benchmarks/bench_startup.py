@@ -0,0 +1,48 @@
+"""
+Benchmark cold start: waktu import modul dan waktu sampai clean_video_df pertama
+selesai, masing-masing di proses Python baru.
+
+    python -m benchmarks.bench_startup --repeat 5
+"""
+import sys
+import argparse
+import statistics
+import subprocess
+
+CASES = {
+    "import scraping": "import src.scraping.video_scraping",
+    "import cleaning": "import src.cleaning.video_cleaning",
+    "import engagement": "import src.anlysis.engagement",
+    "import keyword_hashtag": "import src.anlysis.keyword_hashtag",
+    "home page imports": (
+        "import src.scraping.video_scraping, src.scraping.scrape_cache, "
+        "src.scraping.incremental, src.cleaning.video_cleaning"
+    ),
+    "first clean_video_df": (
+        "import pandas as pd\n"
+        "from src.cleaning.video_cleaning import clean_video_df, COLUMNS_NEEDED\n"
+        "df = pd.DataFrame([dict.fromkeys(COLUMNS_NEEDED, 0)])\n"
+        "df['text'] = 'Makanan enak #fyp'\n"
+        "df['createTimeISO'] = '2025-01-01T00:00:00Z'\n"
+        "clean_video_df(df)"
+    ),
+}
+
+TEMPLATE = "import time\nt0 = time.perf_counter()\n{code}\nprint(time.perf_counter() - t0)\n"
+
+def run_case(code):
+    out = subprocess.run([sys.executable, "-c", TEMPLATE.format(code=code)],
+                         capture_output=True, text=True, check=True)
+    return float(out.stdout.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for name, code in CASES.items():
+        times = [run_case(code) for _ in range(args.repeat)]
+        print(f"{name:<24} median {statistics.median(times):6.3f}s  min {min(times):6.3f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark filter hashtag/author: scan kolom list hashtags per baris (cara lama)
+vs inverted index VideoIndex (posting list row id urut).
+
+    python -m benchmarks.bench_video_index --rows 1000000
+"""
+import time
+import argparse
+import numpy as np
+import pandas as pd
+
+from src.anlysis.video_index import VideoIndex
+
+QUERIES = [
+    {"hashtags_all": ("#t0", "#t1")},
+    {"hashtags_any": ("#t2", "#t3", "#t4"), "hashtags_none": ("#t0",)},
+    {"authors": ("a1", "a2"), "hashtags_none": ("#t0",)},
+    {"hashtags_all": ("#t0",), "hashtags_any": ("#t5", "#t6"), "authors": ("a7", "a8", "a9")},
+]
+
+def make_videos(n_rows, n_tags=20_000, n_authors=5_000, seed=42):
+    # hashtag zipf-like, 0-7 hashtag per video
+    rng = np.random.default_rng(seed)
+    weights = 1 / np.arange(1, n_tags + 1) ** 1.1
+    lengths = rng.integers(0, 8, n_rows)
+    flat = rng.choice(n_tags, size=lengths.sum(), p=weights / weights.sum())
+    hashtags = [[f"#t{x}" for x in chunk] for chunk in np.split(flat, np.cumsum(lengths)[:-1])]
+    authors = pd.Categorical([f"a{x}" for x in rng.integers(0, n_authors, n_rows)])
+    return pd.DataFrame({"hashtags": hashtags, "authorMeta.name": authors})
+
+def scan_filter(df, hashtags_all=(), hashtags_any=(), hashtags_none=(), authors=(), authors_none=()):
+    # cara lama: cek setiap list hashtag baris per baris
+    tag_sets = df["hashtags"].apply(set)
+    mask = np.ones(len(df), dtype=bool)
+    for tag in hashtags_all:
+        mask &= tag_sets.apply(lambda tags: tag in tags).to_numpy()
+    if hashtags_any:
+        mask &= tag_sets.apply(lambda tags: not tags.isdisjoint(hashtags_any)).to_numpy()
+    if authors:
+        mask &= df["authorMeta.name"].isin(authors).to_numpy()
+    for tag in hashtags_none:
+        mask &= ~tag_sets.apply(lambda tags: tag in tags).to_numpy()
+    if authors_none:
+        mask &= ~df["authorMeta.name"].isin(authors_none).to_numpy()
+    return np.flatnonzero(mask)
+
+def timed(func):
+    t0 = time.perf_counter()
+    result = func()
+    return time.perf_counter() - t0, result
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    for n in args.rows:
+        df = make_videos(n)
+        t_build, index = timed(lambda: VideoIndex(df))
+        print(f"rows {n}: build index {t_build:.2f} s")
+        print(f"{'query':>4} {'scan ms':>9} {'index ms':>9} {'rows':>8} {'same':>5}")
+        for i, query in enumerate(QUERIES):
+            t_scan, expected = timed(lambda: scan_filter(df, **query))
+            t_index, result = timed(lambda: index.query(**query))
+            print(f"{i:>4} {t_scan * 1000:>9.1f} {t_index * 1000:>9.2f} {len(result):>8} "
+                  f"{str(np.array_equal(result, expected)):>5}")
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,17 @@
 import os
-import re
-import numpy as np
 import pandas as pd
 import streamlit as st
-import matplotlib.pyplot as plt
 
-from wordcloud import WordCloud
 from streamlit_option_menu import option_menu
 
-from src.scraping.video_scraping import scrape_videos
-from src.cleaning.video_cleaning import clean_video_df
-from src.anlysis.engagement import authors_videos, likes_analysis, comment_analysis, share_analysis, saved_analysis, views_analysis, duration_analysis, videos_over_time, likes_over_time
-from src.anlysis.keyword_hashtag import hashtags_association
+from src.scraping.video_scraping import scrape_videos, scrape_videos_batch, iter_video_pages
+from src.scraping.scrape_cache import ScrapeCache
+from src.scraping.incremental import VideoStore, scrape_incremental
+from src.cleaning.video_cleaning import clean_video_df, clean_video_pages, merge_clean_pages, apply_near_duplicates, emoji_column_counts, COLUMNS_NEEDED
+from src.cleaning.schema import compact_video_df, dataset_fingerprint
+from src.anlysis.video_index import VideoIndex
+# modul analisis, wordcloud & matplotlib di-import di halaman yang memakainya
+# supaya halaman Home tidak ikut menanggung waktu import-nya
 
 # Setup halaman utama
 st.set_page_config(
@@ -20,6 +20,84 @@ st.set_page_config(
     layout="wide"
 )
 
+@st.cache_resource
+def get_scrape_cache():
+    # satu cache per proses supaya statistik hit/miss tidak reset tiap rerun
+    return ScrapeCache(ttl=3600)
+
+@st.cache_resource
+def get_video_store():
+    return VideoStore()
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def cached_result(fingerprint, name, params, _build):
+    # figure/tabel di-cache per (fingerprint dataset, nama, parameter), LRU max_entries;
+    # _build tidak ikut di-hash sehingga DataFrame tidak di-hash ulang setiap rerun
+    return _build()
+
+def cached_figure(fingerprint, name, params, build):
+    # figure plotly disimpan dalam bentuk siap kirim: typed array biner + Scattergl untuk trace besar
+    # (plotly otomatis memakai orjson untuk serialisasi jika terpasang)
+    from src.anlysis.render import optimize_figure
+    return cached_result(fingerprint, name, params, lambda: optimize_figure(build()))
+
+def get_fingerprint(df):
+    if "video_df_fingerprint" not in st.session_state:
+        st.session_state["video_df_fingerprint"] = dataset_fingerprint(df)
+    return st.session_state["video_df_fingerprint"]
+
+def get_video_index(df):
+    if "video_index" not in st.session_state:
+        st.session_state["video_index"] = VideoIndex(df)
+    return st.session_state["video_index"]
+
+def filter_videos(df, page):
+    # drill-down hashtag/author lewat inverted index (tanpa scan kolom hashtags);
+    # key cache = fingerprint dataset + query supaya hasil per filter ikut di-cache.
+    # Returns (df terfilter, key cache, posisi baris atau None kalau tanpa filter)
+    index = get_video_index(df)
+    fingerprint = get_fingerprint(df)
+
+    with st.expander("🔎 Filter videos by hashtag / author"):
+        hashtag_options = index.hashtags
+        author_options = index.authors
+        col_tags, col_authors = st.columns(2)
+        with col_tags:
+            hashtags_all = st.multiselect("Has all hashtags (AND)", hashtag_options, key=f"{page}_hashtags_all")
+            hashtags_any = st.multiselect("Has any hashtag (OR)", hashtag_options, key=f"{page}_hashtags_any")
+            hashtags_none = st.multiselect("Exclude hashtags (NOT)", hashtag_options, key=f"{page}_hashtags_none")
+        with col_authors:
+            authors = st.multiselect("Authors (OR)", author_options, key=f"{page}_authors")
+            authors_none = st.multiselect("Exclude authors (NOT)", author_options, key=f"{page}_authors_none")
+
+        # dataset hasil mode "Mark": near-duplicate bisa dikeluarkan dari semua chart
+        exclude_duplicates = False
+        if "is_near_duplicate" in df.columns:
+            n_marked = int(df["is_near_duplicate"].sum())
+            exclude_duplicates = st.checkbox(f"Exclude near-duplicate captions ({n_marked} marked)",
+                                             value=True, key=f"{page}_exclude_duplicates")
+
+    query = {
+        "hashtags_all": tuple(hashtags_all),
+        "hashtags_any": tuple(hashtags_any),
+        "hashtags_none": tuple(hashtags_none),
+        "authors": tuple(authors),
+        "authors_none": tuple(authors_none),
+    }
+    if not any(query.values()) and not exclude_duplicates:
+        return df, fingerprint, None
+
+    rows = index.query(**query)
+    if exclude_duplicates:
+        keep = ~df["is_near_duplicate"].to_numpy(dtype=bool)
+        rows = rows[keep[rows]]
+        query["exclude_near_duplicates"] = True
+    if len(rows) == 0:
+        st.warning("⚠ No videos match the selected filter.")
+        st.stop()
+    st.caption(f"Filter aktif: {len(rows)} video")
+    return df.iloc[rows], (fingerprint, tuple(query.items())), rows
+
 # Styling CSS
 st.markdown("""
 <style>
@@ -145,21 +223,100 @@ if selected == "Home":
     if token:
         st.session_state['api_token'] = token
 
-    hashtag = st.text_input("🏷️ Hashtag or Keyword", placeholder="e.g., mbg, skincare, ruu")
+    hashtag = st.text_input("🏷️ Hashtag or Keyword", placeholder="e.g., mbg, skincare, ruu (pisahkan dengan koma)")
     limit = st.slider("📦 Number of Videos", 10, 700, 50)
+    scrape_mode = st.radio(
+        "⚙️ Scraping Mode",
+        ["Normal", "Streaming", "Incremental"],
+        horizontal=True,
+        help="Streaming: hasil diambil per page selama scraping berjalan. "
+             "Incremental: hanya video baru yang diambil lalu digabung ke dataset tersimpan."
+    )
+
+    dedup_mode = st.radio(
+        "🧹 Near-duplicate Captions",
+        ["Keep", "Mark", "Collapse"],
+        horizontal=True,
+        help="Caption repost/template dari author berbeda. "
+             "Mark: hanya ditandai (bisa dikeluarkan lewat filter di halaman Engagement & Keyword), "
+             "Collapse: hanya video pertama yang disimpan."
+    )
+    dedup_threshold = st.slider("Similarity threshold", 0.5, 1.0, 0.8, 0.05,
+                                disabled=dedup_mode == "Keep")
 
     start_btn = st.button("🚀 Start")
 
+    cache_stats = get_scrape_cache().stats()
+    st.caption(f"Cache scraping: {cache_stats['hits']} hit / {cache_stats['misses']} miss, "
+               f"{cache_stats['entries']} entry ({cache_stats['bytes'] / 1024:.0f} KB)")
+    if "video_df_memory" in st.session_state:
+        mem = st.session_state["video_df_memory"]
+        st.caption(f"Memori dataset: {mem['bytes_before'] / 1024:.0f} KB → {mem['bytes_after'] / 1024:.0f} KB "
+                   f"({mem['ratio']:.1f}x lebih kecil)")
+
     if start_btn:
-        if not token or not hashtag:
+        hashtag_list = [h.strip() for h in hashtag.split(",") if h.strip()]
+
+        if not token or not hashtag_list:
             st.warning("Please enter both token and hashtag first.")
             st.stop()
 
+        # Counter emoji dari clean_video_df (hanya jalur yang tidak menggabung page)
+        emoji_counts = None
         with st.spinner("Scraping TikTok data..."):
-            df_raw = scrape_videos(token, hashtag, limit)
-            df = clean_video_df(df_raw)
+            if scrape_mode == "Incremental":
+                parts = []
+                for tag in hashtag_list:
+                    df_tag, info = scrape_incremental(token, tag, get_video_store(), limit)
+                    st.info(f"#{tag}: {info['new']} video baru, {info['updated']} video di-update")
+                    parts.append(df_tag)
+                df = merge_clean_pages(parts)
+            elif scrape_mode == "Streaming":
+                # page yang sudah masuk langsung dibersihkan sebelum run selesai;
+                # beberapa hashtag di-stream satu per satu
+                progress = st.empty()
+                parts = []
+                for tag in hashtag_list:
+                    pages = iter_video_pages(token, tag, limit, columns=COLUMNS_NEEDED)
+                    if len(hashtag_list) > 1:
+                        pages = (page.assign(sourceHashtag=tag) for page in pages)
+                    try:
+                        for df_part in clean_video_pages(pages):
+                            parts.append(df_part)
+                            progress.info(f"#{tag}: video diterima: {sum(len(p) for p in parts)}")
+                    except TimeoutError as e:
+                        # run sudah di-abort oleh iter_video_pages
+                        st.error(f"⚠ #{tag}: {e}")
+                        st.stop()
+                df = merge_clean_pages(parts)
+                progress.empty()
+            else:
+                if len(hashtag_list) > 1:
+                    df_raw = scrape_videos_batch(token, hashtag_list, limit, columns=COLUMNS_NEEDED,
+                                                 cache=get_scrape_cache())
+                else:
+                    df_raw = scrape_videos(token, hashtag_list[0], limit, columns=COLUMNS_NEEDED,
+                                           cache=get_scrape_cache())
+                df, emoji_counts = clean_video_df(df_raw, return_emoji_counts=True)
+
+            # near-duplicate dicek setelah semua page/hashtag digabung
+            dedup = {"Keep": None, "Mark": "mark", "Collapse": "collapse"}[dedup_mode]
+            df = apply_near_duplicates(df, dedup, dedup_threshold)
+            if dedup == "collapse" and emoji_counts is not None:
+                emoji_counts = emoji_column_counts(df["emoji"])
+
+        if df.empty:
+            st.warning("⚠ No videos found for the given hashtag(s).")
+            st.stop()
 
+        # schema hemat memori sebelum disimpan di session state
+        df, schema_report = compact_video_df(df, return_report=True)
         st.session_state["video_df"] = df
+        st.session_state["video_df_memory"] = schema_report
+        st.session_state["video_df_fingerprint"] = dataset_fingerprint(df)
+        st.session_state["video_emoji_counts"] = emoji_counts
+        # inverted index hashtag/author untuk filter di halaman Engagement & Keyword
+        st.session_state["video_index"] = VideoIndex(df)
         st.success(f"Scraping selesai! Total video: {len(df)}")
 
         # Directly navigate to Page 2
@@ -171,6 +328,11 @@ elif selected == "Engagement":
         st.error("⚠ No data available. Please scrape data first on the Home page.")
         st.stop()
 
+    from src.anlysis.engagement import authors_videos, likes_analysis, comment_analysis, share_analysis, saved_analysis, views_analysis, duration_analysis, videos_over_time, likes_over_time
+    from src.anlysis.ranking import top_bottom_k
+    from src.anlysis.time_buckets import TimeBuckets
+    from src.anlysis.rollup import EngagementCube
+
     df = st.session_state["video_df"]
     
     BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -189,6 +351,9 @@ elif selected == "Engagement":
     with col2:
         st.image(IMG_PATH, use_column_width=True)
 
+    df_all = df
+    df, fingerprint, filter_rows = filter_videos(df, "engagement")
+
     col3, col4, col5 = st.columns(3)
     with col3:
         # Card total videos
@@ -240,17 +405,41 @@ elif selected == "Engagement":
         </div>
         """, unsafe_allow_html=True)
 
-    # grafik
-    st.plotly_chart(videos_over_time(df), use_container_width=True)
-    st.plotly_chart(likes_over_time(df), use_container_width=True)
+    # grafik (di-cache per fingerprint dataset + filter: rerun & pindah halaman tidak menghitung ulang)
+
+    # timestamp di-sort & di-bucket sekali untuk kedua chart waktu
+    def buckets():
+        return cached_result(fingerprint, "time_buckets", (), lambda: TimeBuckets(df, ['diggCount']))
+
+    # titik per trace dibatasi (LTTB) supaya figure tetap ringan untuk rentang bertahun-tahun
+    max_points = st.select_slider("📉 Max Points per Trace", [500, 1000, 2000, 5000], value=2000)
+    st.plotly_chart(cached_figure(fingerprint, "videos_over_time", (max_points,),
+                                  lambda: videos_over_time(df, buckets(), max_points)), use_container_width=True)
+    st.plotly_chart(cached_figure(fingerprint, "likes_over_time", (max_points,),
+                                  lambda: likes_over_time(df, buckets(), max_points)), use_container_width=True)
+
+    # rollup author x hari x hashtag, dibangun sekali per dataset;
+    # filter hashtag/author cukup mengambil subset fakta cube, bukan membangun ulang
+    def cube():
+        full = cached_result(get_fingerprint(df_all), "engagement_cube", (), lambda: EngagementCube(df_all))
+        if filter_rows is None:
+            return full
+        return cached_result(fingerprint, "engagement_cube_subset", (), lambda: full.subset(filter_rows))
+
+    st.plotly_chart(cached_figure(fingerprint, "authors_videos", (),
+                                  lambda: authors_videos(df, cube())), use_container_width=True)
+
+    # top/bottom k semua metrik dihitung sekali, dipakai keenam chart
+    top_k = st.slider("🏆 Top/Bottom Videos", 3, 20, 5)
 
-    st.plotly_chart(authors_videos(df), use_container_width=True)
-    st.plotly_chart(likes_analysis(df), use_container_width=True)
-    st.plotly_chart(comment_analysis(df), use_container_width=True)
-    st.plotly_chart(share_analysis(df), use_container_width=True)
-    st.plotly_chart(saved_analysis(df), use_container_width=True)
-    st.plotly_chart(views_analysis(df), use_container_width=True)
-    st.plotly_chart(duration_analysis(df), use_container_width=True)
+    def ranking():
+        return cached_result(fingerprint, "top_bottom_k", (top_k,), lambda: top_bottom_k(df, k=top_k))
+
+    for analysis in [likes_analysis, comment_analysis, share_analysis,
+                     saved_analysis, views_analysis, duration_analysis]:
+        fig = cached_figure(fingerprint, analysis.__name__, (top_k,),
+                            lambda: analysis(df, top_k, ranking()))
+        st.plotly_chart(fig, use_container_width=True)
 
     # tabel engagement rate
     required_cols = ['authorMeta.name', 'webVideoUrl', 'diggCount', 'commentCount',
@@ -260,23 +449,9 @@ elif selected == "Engagement":
     if missing_cols:
         st.error(f"Kolom berikut tidak ditemukan di dataset: {missing_cols}")
     else:
-        engagement_rate = df[required_cols].copy()
-
-        # Hitung Engagement Rate
-        engagement_rate['engagement_rate'] = (
-            engagement_rate['diggCount']
-            + engagement_rate['commentCount']
-            + engagement_rate['shareCount']
-            + engagement_rate['collectCount']
-        ) / engagement_rate['playCount'].replace(0, np.nan) * 100
-
-        # Bersihkan nilai inf/nan
-        engagement_rate['engagement_rate'] = (engagement_rate['engagement_rate'].replace([np.inf, -np.inf], np.nan).fillna(0).round(2))
-        engagement_rate = engagement_rate.sort_values(by='engagement_rate', ascending=False).reset_index(drop=True)
-        engagement_rate["No"] = np.arange(1, len(engagement_rate) + 1)
+        engagement_rate = cube().videos
 
         st.subheader("📊 Engagement Rate Ranking")
-        engagement_rate["engagement_rate_for_bar"] = (engagement_rate["engagement_rate"].clip(0, 100))
 
         columns_to_show = ["No", "authorMeta.name", "webVideoUrl",
                            "diggCount", "commentCount", "shareCount",
@@ -304,11 +479,32 @@ elif selected == "Engagement":
             use_container_width=True
         )
 
+    # ringkasan per author & hashtag dari rollup; filter tanggal hanya meng-query tabel agregat
+    st.subheader("👤 Author & Hashtag Engagement Summary")
+    day_range = cube().day_range
+    if day_range is not None:
+        first_day, last_day = day_range
+        date_range = st.date_input("📅 Date Range", (first_day.date(), last_day.date()),
+                                   min_value=first_day.date(), max_value=last_day.date())
+        if len(date_range) == 2:
+            start = pd.Timestamp(date_range[0], tz=first_day.tz)
+            end = pd.Timestamp(date_range[1], tz=first_day.tz)
+            col_authors, col_hashtags = st.columns(2)
+            with col_authors:
+                st.write("**Authors**")
+                st.dataframe(cube().authors(start, end), use_container_width=True)
+            with col_hashtags:
+                st.write("**Hashtags**")
+                st.dataframe(cube().hashtags(start, end), use_container_width=True)
+
 elif selected == "Keyword and Hashtag":
     if "video_df" not in st.session_state:
         st.error("⚠ No data available. Please scrape data first on the Home page.")
         st.stop()
 
+    from src.anlysis.wordclouds import term_frequencies, render_wordclouds, emoji_frequency_figure
+    from src.anlysis.keyword_hashtag import hashtags_association, MEASURES
+
     df = st.session_state["video_df"]
 
     BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -326,54 +522,74 @@ elif selected == "Keyword and Hashtag":
     with col2:
         st.image(IMG_PATH, use_column_width=True)
 
-    def generate_wordcloud(text, title):
-        wc = WordCloud(
-            width=800,
-            height=400,
-            background_color="white",
-            colormap="viridis"
-        ).generate(text)
-
-        fig, ax = plt.subplots(figsize=(10, 5))
-        ax.imshow(wc, interpolation="bilinear")
-        ax.set_title(title, fontsize=18)
-        ax.axis("off")
-        return fig
+    # wordcloud & network di-cache per fingerprint dataset + filter
+    df, fingerprint, filter_rows = filter_videos(df, "keyword")
 
     st.subheader("💬 WordCloud Analysis")
 
+    # frekuensi langsung dari kolom bersih, wordcloud caption & hashtag dirender paralel (PNG);
+    # tanpa filter, Counter emoji hasil cleaning dipakai ulang
+    emoji_counts = st.session_state.get("video_emoji_counts") if filter_rows is None else None
+    frequencies = cached_result(fingerprint, "term_frequencies", (),
+                                lambda: term_frequencies(df, emoji_counts=emoji_counts))
+
+    def wordclouds():
+        return render_wordclouds({
+            "caption": (frequencies["caption"], "Caption WordCloud"),
+            "hashtag": (frequencies["hashtag"], "Hashtag WordCloud"),
+        })
+
+    images = cached_result(fingerprint, "wordclouds", (), wordclouds)
+
     # Caption
-    caption_text = " ".join(df["text_clean"].astype(str).tolist())
     st.write("### 📝 Caption WordCloud")
-    st.pyplot(generate_wordcloud(caption_text, "Caption WordCloud"))
+    if images["caption"] is None:
+        st.info("⚠ No caption words found")
+    else:
+        st.image(images["caption"], use_column_width=True)
 
     # Hashtag
-    def clean_hashtags(text):
-        tags = re.findall(r"#\w+", str(text))
-        return " ".join(tags)
-
-    hashtag_text = " ".join(df["hashtags"].apply(clean_hashtags).tolist())
     st.write("### #️⃣ Hashtag WordCloud")
-    st.pyplot(generate_wordcloud(hashtag_text, "Hashtag WordCloud"))
+    if images["hashtag"] is None:
+        st.info("⚠ No hashtags found in captions")
+    else:
+        st.image(images["hashtag"], use_column_width=True)
 
     # Emoji
-    emoji_list = df["emoji"].dropna().astype(str).tolist()
-    emoji_list = [e for e in emoji_list if e.strip() != ""]
-
-    st.write("### 😊 Emoji Caption WordCloud")
-
-    if len(emoji_list) == 0:
+    # emoji sebagai bar chart: font wordcloud tidak punya glyph emoji
+    st.write("### 😊 Top Emoji in Captions")
+    if not frequencies["emoji"]:
         st.info("⚠ No emoji found in captions")
     else:
-        emoji_text = " ".join(emoji_list)  # gabungkan menjadi string
-        try:
-            st.pyplot(generate_wordcloud(emoji_text, "Emoji WordCloud"))
-        except ValueError as ve:
-            st.warning(f"WordCloud Emoji Failed: {ve}")
+        st.plotly_chart(cached_result(fingerprint, "emoji_frequency", (),
+                                      lambda: emoji_frequency_figure(frequencies["emoji"])))
 
     # Analisis Asosiasi Hashtag
     st.write('### ⛓️ Hashtag Association Network')
-    df_top_pairs, fig_assoc = hashtags_association(df, top_n_pairs=30)
+
+    # ranking pasangan: count mentah atau ukuran asosiasi (PMI, lift, ...)
+    col_rank, col_support = st.columns(2)
+    with col_rank:
+        rank_by = st.selectbox(
+            "Rank pairs by",
+            MEASURES,
+            format_func=lambda m: {"count": "Co-occurrence count", "pmi": "PMI", "npmi": "NPMI",
+                                   "lift": "Lift", "jaccard": "Jaccard", "confidence": "Confidence"}[m]
+        )
+    with col_support:
+        min_support = st.slider("Minimum support (videos)", min_value=1, max_value=50,
+                                value=1 if rank_by == "count" else 3)
+
+    def association():
+        from src.anlysis.render import optimize_figure
+        # warm start layout network hanya dari network sesi ini sendiri
+        layout_state = st.session_state.setdefault("hashtag_layout", {})
+        df_pairs, fig = hashtags_association(df, top_n_pairs=30, rank_by=rank_by, min_support=min_support,
+                                             layout_state=layout_state)
+        return df_pairs, optimize_figure(fig)
+
+    df_top_pairs, fig_assoc = cached_result(fingerprint, "hashtags_association",
+                                            (30, rank_by, min_support), association)
 
     # tampilkan di Streamlit
     col3, col4 = st.columns([3,2])
@@ -0,0 +1,35 @@
+import numpy as np
+
+# ukuran asosiasi pasangan hashtag yang bisa dipakai untuk ranking
+MEASURES = ('count', 'pmi', 'npmi', 'lift', 'jaccard', 'confidence')
+
+def association_measures(counts, support_a, support_b, n_videos):
+    """
+    Ukuran asosiasi untuk banyak pasangan sekaligus (vektor numpy).
+    counts = jumlah video berisi kedua hashtag, support_a/b = jumlah video per hashtag.
+    confidence = max(P(b|a), P(a|b)), arah aturan yang paling kuat.
+    """
+    c = np.asarray(counts, dtype=np.float64)
+    a = np.asarray(support_a, dtype=np.float64)
+    b = np.asarray(support_b, dtype=np.float64)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        lift = c * n_videos / (a * b)
+        pmi = np.log(lift)
+        p_pair = c / n_videos
+        # pasangan yang muncul di semua video -> npmi = 1
+        npmi = np.where(p_pair < 1, pmi / -np.log(p_pair), 1.0)
+        jaccard = c / (a + b - c)
+        confidence = c / np.minimum(a, b)
+
+    return {
+        'pmi': pmi,
+        'npmi': npmi,
+        'lift': lift,
+        'jaccard': jaccard,
+        'confidence': confidence,
+    }
+
+def check_measure(rank_by):
+    if rank_by not in MEASURES:
+        raise ValueError(f"rank_by harus salah satu dari {MEASURES}, bukan {rank_by!r}")
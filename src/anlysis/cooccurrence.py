@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+
+from scipy import sparse
+
+from src.anlysis.association import association_measures, check_measure
+
+def incidence_matrix(hashtag_lists, min_support=1):
+    """
+    Matriks incidence biner video x hashtag (CSR) dengan hashtag di-encode integer.
+    Hashtag yang muncul di kurang dari `min_support` video dibuang sebelum XᵀX.
+    Returns (X, vocab, support); vocab urut alfabet sehingga pasangan (i < j) = pasangan terurut.
+    """
+    tags = pd.Series(hashtag_lists).reset_index(drop=True)
+    n_videos = len(tags)
+    flat = tags.explode().dropna()
+
+    codes, vocab = pd.factorize(flat.to_numpy(dtype=object), sort=True)
+    rows = flat.index.to_numpy(dtype=np.int64)
+
+    X = sparse.csr_matrix(
+        (np.ones(len(codes), dtype=np.int32), (rows, codes)),
+        shape=(n_videos, len(vocab))
+    )
+    # hashtag dobel di satu caption dihitung sekali (seperti set(sublist))
+    X.sum_duplicates()
+    X.data[:] = 1
+    vocab = np.asarray(vocab, dtype=object)
+
+    support = np.bincount(X.indices, minlength=len(vocab))
+    if min_support > 1:
+        keep = np.flatnonzero(support >= min_support)
+        X, vocab, support = X[:, keep], vocab[keep], support[keep]
+    return X, vocab, support
+
+def cooccurrence_matrix(X, min_support=1):
+    """Jumlah video per pasangan hashtag: segitiga atas (tanpa diagonal) dari Xᵀ·X."""
+    C = sparse.triu((X.T @ X).tocsr(), k=1, format='coo')
+    if min_support > 1:
+        keep = C.data >= min_support
+        C = sparse.coo_matrix((C.data[keep], (C.row[keep], C.col[keep])), shape=C.shape)
+    return C
+
+def top_pairs(C, vocab, top_n=30, measures=None, rank_by='count'):
+    """
+    Top-N pasangan hashtag menurut `rank_by` tanpa sort semua pasangan:
+    argpartition lalu sort hanya N kandidat; tie -> count, lalu urutan alfabet pasangan.
+    `measures` = dict array sejajar C.data (dari association_measures) ikut jadi kolom.
+    """
+    check_measure(rank_by)
+    measures = measures or {}
+    counts = C.data
+    key = counts if rank_by == 'count' else measures[rank_by]
+
+    if 0 < top_n < len(key):
+        candidates = np.argpartition(-key, top_n - 1)[:top_n]
+        # ikutkan semua tie di batas supaya hasil tidak bergantung argpartition
+        kth = key[candidates].min()
+        candidates = np.flatnonzero(key >= kth)
+    else:
+        candidates = np.arange(len(key))
+
+    rows, cols = C.row[candidates], C.col[candidates]
+    order = np.lexsort((cols, rows, -counts[candidates], -key[candidates]))[:top_n]
+    selected = candidates[order]
+
+    table = pd.DataFrame({
+        'pair': pd.Series(list(zip(vocab[rows[order]], vocab[cols[order]])), dtype=object),
+        'count': counts[selected].astype(np.int64),
+    })
+    for name, values in measures.items():
+        table[name] = values[selected]
+    return table
+
+def hashtag_associations(hashtag_lists, top_n=30, rank_by='count', min_support=1):
+    """
+    Top-N pasangan hashtag beserta count, PMI, NPMI, lift, Jaccard dan confidence,
+    diurutkan menurut `rank_by`. Hashtag dan pasangan dengan support < `min_support`
+    video tidak dinilai.
+    """
+    check_measure(rank_by)
+    X, vocab, support = incidence_matrix(hashtag_lists, min_support)
+    C = cooccurrence_matrix(X, min_support)
+    measures = association_measures(C.data, support[C.row], support[C.col], X.shape[0])
+    return top_pairs(C, vocab, top_n, measures, rank_by)
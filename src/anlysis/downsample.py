@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+
+# batas default titik per trace time series
+DEFAULT_MAX_POINTS = 2000
+
+def _as_float(values):
+    if pd.api.types.is_datetime64_any_dtype(values):
+        # termasuk datetime dengan timezone
+        values = pd.DatetimeIndex(values).asi8
+    values = np.asarray(values, dtype=np.float64)
+    # geser ke titik pertama supaya luas segitiga tidak kehilangan presisi
+    return values - values[0] if len(values) else values
+
+def lttb_indices(x, y, max_points):
+    """
+    Largest-Triangle-Three-Buckets: pilih `max_points` titik yang paling
+    menjaga bentuk kurva (titik pertama & terakhir selalu ikut).
+    Returns index titik terpilih (urut).
+    """
+    n = len(x)
+    if max_points >= n or max_points < 3:
+        return np.arange(n)
+
+    x = _as_float(x)
+    y = np.asarray(y, dtype=np.float64)
+
+    # n - 2 titik tengah dibagi ke max_points - 2 bucket
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.intp)
+    selected = np.empty(max_points, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+
+    a = 0
+    for i in range(max_points - 2):
+        start, end = edges[i], edges[i + 1]
+        # titik rata-rata bucket berikutnya (bucket terakhir -> titik terakhir)
+        next_start = end
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a])
+                      - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+
+    return selected
+
+def minmax_indices(y, max_points):
+    """Decimation min/max: setiap bucket menyimpan titik minimum dan maksimumnya."""
+    n = len(y)
+    if max_points >= n or max_points < 4:
+        return np.arange(n)
+
+    y = np.asarray(y, dtype=np.float64)
+    # 2 titik per bucket + titik pertama & terakhir <= max_points
+    n_buckets = (max_points - 2) // 2
+    edges = np.linspace(0, n, n_buckets + 1).astype(np.intp)
+    lows = np.array([start + np.argmin(y[start:end]) for start, end in zip(edges[:-1], edges[1:])])
+    highs = np.array([start + np.argmax(y[start:end]) for start, end in zip(edges[:-1], edges[1:])])
+    return np.unique(np.concatenate([lows, highs, [0, n - 1]]))
+
+def downsample_frame(frame, x_col, y_col, max_points=DEFAULT_MAX_POINTS, method='lttb'):
+    """
+    Kurangi jumlah baris frame (urut menurut x) untuk digambar sebagai trace.
+    `max_points=None` -> tanpa downsampling.
+    """
+    if max_points is None or len(frame) <= max_points:
+        return frame
+
+    if method == 'lttb':
+        selected = lttb_indices(frame[x_col], frame[y_col].to_numpy(), max_points)
+    elif method == 'minmax':
+        selected = minmax_indices(frame[y_col].to_numpy(), max_points)
+    else:
+        raise ValueError(f"method harus 'lttb' atau 'minmax', bukan {method!r}")
+    return frame.iloc[selected]
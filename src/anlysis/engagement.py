@@ -1,13 +1,19 @@
-import pandas as pd
-
 from plotly import express as px
 from plotly import graph_objects as go
-from src.cleaning.video_cleaning import clean_video_df
+from src.anlysis.ranking import top_bottom_k
+from src.anlysis.time_buckets import TimeBuckets
+from src.anlysis.downsample import downsample_frame, DEFAULT_MAX_POINTS
 
-def authors_videos(df):
+def authors_videos(df, cube=None):
     """Analisis author dengan video terbanyak dan tersedikit."""
     # Top & Bottom Authors by Video Count
-    all_authors = df['authorMeta.name'].value_counts()
+    if cube is not None:
+        # jumlah video per author dari rollup (EngagementCube)
+        all_authors = cube.authors()['videos']
+    else:
+        all_authors = df['authorMeta.name'].value_counts()
+        # kolom category ikut menghitung author yang tidak muncul (count 0)
+        all_authors = all_authors[all_authors > 0]
     mean_value = all_authors.mean()
 
     top_authors = all_authors.head(5)
@@ -112,91 +118,83 @@ def authors_videos(df):
 
     return vid_authors
 
-def likes_analysis(df):
-    """Analisis video dengan likes tertinggi dan terendah."""
-    # =================Top & Bottom Videos by Likes==================
-    # Top 5 likes
-    top_likes = (df.nlargest(5, 'diggCount')[['authorMeta.name', 'diggCount']].sort_values(by='diggCount', ascending=False))
-    top_likes['video_label'] = top_likes['authorMeta.name'] + ' - Vid ' + (top_likes.groupby('authorMeta.name').cumcount() + 1).astype(str)
-
-    # Bottom 5 likes
-    bottom_likes = (df.nsmallest(5, 'diggCount')[['authorMeta.name', 'diggCount']].sort_values(by='diggCount', ascending=False))
-    bottom_likes['video_label'] = bottom_likes['authorMeta.name'] + ' - Vid ' + (bottom_likes.groupby('authorMeta.name').cumcount() + 1).astype(str)
+def _top_bottom_figure(ranking, metric, noun, yaxis_title, k=5, top_name=None):
+    """Bar chart top/bottom k video untuk satu metrik (hasil top_bottom_k) dengan dropdown."""
+    top = ranking[metric]['top']
+    bottom = ranking[metric]['bottom']
+    mean_value = ranking[metric]['mean']
 
-    # Mean
-    mean_likes = df['diggCount'].mean()
-    fig_likes = go.Figure()
+    fig = go.Figure()
 
     # 1
-    fig_likes.add_trace(go.Bar(
-        x=top_likes['video_label'],
-        y=top_likes['diggCount'],
-        name="Top 5 Videos",
+    fig.add_trace(go.Bar(
+        x=top['video_label'],
+        y=top[metric],
+        name=top_name or f"Top {k} Videos",
         marker_color="midnightblue",
         visible=True,
         text=None
     ))
 
     # 2
-    fig_likes.add_trace(go.Scatter(
+    fig.add_trace(go.Scatter(
         x=[None], y=[None],
         mode="lines",
         line=dict(color="orange", dash="dash"),
-        name=f"Mean Likes ({mean_likes:.2f})",
+        name=f"Mean {noun} ({mean_value:.2f})",
         showlegend=True,
         visible=True
     ))
 
     # 3
-    fig_likes.add_trace(go.Bar(
-        x=bottom_likes['video_label'],
-        y=bottom_likes['diggCount'],
-        name="Bottom 5 Videos",
+    fig.add_trace(go.Bar(
+        x=bottom['video_label'],
+        y=bottom[metric],
+        name=f"Bottom {k} Videos",
         marker_color="midnightblue",
         visible=False,
-        text=bottom_likes['diggCount'],          
-        textposition='outside'                   
+        text=bottom[metric],
+        textposition='outside'
     ))
 
     # 4
-    fig_likes.add_trace(go.Scatter(
+    fig.add_trace(go.Scatter(
         x=[None], y=[None],
         mode="lines",
         line=dict(color="orange", dash="dash"),
-        name=f"Mean Likes ({mean_likes:.2f})",
+        name=f"Mean {noun} ({mean_value:.2f})",
         showlegend=True,
         visible=False
     ))
 
     # ADD HLINE MEAN
-    fig_likes.add_hline(
-        y=mean_likes,
+    fig.add_hline(
+        y=mean_value,
         line_dash="dash",
         line_color="orange",
-        annotation_text=f"Mean = {mean_likes:.2f}",
+        annotation_text=f"Mean = {mean_value:.2f}",
         annotation_position="top right"
     )
 
-
     # DROPDOWN MENU
-    fig_likes.update_layout(
+    fig.update_layout(
         updatemenus=[
             dict(
                 buttons=[
                     dict(
-                        label="Top 5 Videos",
+                        label=f"Top {k} Videos",
                         method="update",
                         args=[
                             {"visible": [True, True, False, False]},
-                            {"title": "Top 5 Videos with Highest Likes"}
+                            {"title": f"Top {k} Videos with Highest {noun}"}
                         ]
                     ),
                     dict(
-                        label="Bottom 5 Videos",
+                        label=f"Bottom {k} Videos",
                         method="update",
                         args=[
                             {"visible": [False, False, True, True]},
-                            {"title": "Bottom 5 Videos with Lowest Likes"}
+                            {"title": f"Bottom {k} Videos with Lowest {noun}"}
                         ]
                     ),
                 ],
@@ -211,14 +209,14 @@ def likes_analysis(df):
     )
 
     #   LAYOUT / TITLES
-    fig_likes.update_layout(
+    fig.update_layout(
         title=dict(
-            text="Top 5 Videos with Highest Likes",
+            text=f"Top {k} Videos with Highest {noun}",
             x=0.5,
             xanchor="center"
         ),
         xaxis_title="Video Label",
-        yaxis_title="Likes",
+        yaxis_title=yaxis_title,
         legend=dict(
             orientation="h",
             yanchor="bottom",
@@ -228,625 +226,53 @@ def likes_analysis(df):
         )
     )
 
-    return fig_likes
-
-def comment_analysis(df):
-    """Analisis video dengan comment tertinggi dan terendah."""
-    # =================Top & Bottom Videos by Comments==================
-    # Top 5 comment
-    top_comment = (df.nlargest(5, 'commentCount')[['authorMeta.name', 'commentCount']].sort_values(by='commentCount', ascending=False))
-    top_comment['video_label'] = top_comment['authorMeta.name'] + ' - Vid ' + (top_comment.groupby('authorMeta.name').cumcount() + 1).astype(str)
-
-    # Bottom 5 comment
-    bottom_comment = (df.nsmallest(5, 'commentCount')[['authorMeta.name', 'commentCount']].sort_values(by='commentCount', ascending=False))
-    bottom_comment['video_label'] = bottom_comment['authorMeta.name'] + ' - Vid ' + (bottom_comment.groupby('authorMeta.name').cumcount() + 1).astype(str)
-
-    # Mean
-    mean_comment = df['commentCount'].mean()
-
-    fig_comment = go.Figure()
-
-    # 1
-    fig_comment.add_trace(go.Bar(
-        x=top_comment['video_label'],
-        y=top_comment['commentCount'],
-        name="Top 5 Videos",
-        marker_color="midnightblue",
-        visible=True,
-        text=None
-    ))
-
-    # 2
-    fig_comment.add_trace(go.Scatter(
-        x=[None], y=[None],
-        mode="lines",
-        line=dict(color="orange", dash="dash"),
-        name=f"Mean comment ({mean_comment:.2f})",
-        showlegend=True,
-        visible=True
-    ))
-
-    # 3
-    fig_comment.add_trace(go.Bar(
-        x=bottom_comment['video_label'],
-        y=bottom_comment['commentCount'],
-        name="Bottom 5 Videos",
-        marker_color="midnightblue",
-        visible=False,
-        text=bottom_comment['commentCount'],          
-        textposition='outside'                   
-    ))
-
-    # 4
-    fig_comment.add_trace(go.Scatter(
-        x=[None], y=[None],
-        mode="lines",
-        line=dict(color="orange", dash="dash"),
-        name=f"Mean comment ({mean_comment:.2f})",
-        showlegend=True,
-        visible=False
-    ))
-
-    # ADD HLINE MEAN
-    fig_comment.add_hline(
-        y=mean_comment,
-        line_dash="dash",
-        line_color="orange",
-        annotation_text=f"Mean = {mean_comment:.2f}",
-        annotation_position="top right"
-    )
-
+    return fig
 
-    # DROPDOWN MENU
-    fig_comment.update_layout(
-        updatemenus=[
-            dict(
-                buttons=[
-                    dict(
-                        label="Top 5 Videos",
-                        method="update",
-                        args=[
-                            {"visible": [True, True, False, False]},
-                            {"title": "Top 5 Videos with Highest comment"}
-                        ]
-                    ),
-                    dict(
-                        label="Bottom 5 Videos",
-                        method="update",
-                        args=[
-                            {"visible": [False, False, True, True]},
-                            {"title": "Bottom 5 Videos with Lowest comment"}
-                        ]
-                    ),
-                ],
-                direction="down",
-                showactive=True,
-                x=0,
-                xanchor="left",
-                y=1.15,
-                yanchor="top"
-            )
-        ]
-    )
-
-    #   LAYOUT / TITLES
-    fig_comment.update_layout(
-        title=dict(
-            text="Top 5 Videos with Highest comment",
-            x=0.5,
-            xanchor="center"
-        ),
-        xaxis_title="Video Label",
-        yaxis_title="Comments",
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.05,
-            xanchor="right",
-            x=1
-        )
-    )
+# ranking bisa dihitung sekali dengan top_bottom_k(df, k=k) lalu dipakai keenam chart
+def likes_analysis(df, k=5, ranking=None):
+    """Analisis video dengan likes tertinggi dan terendah."""
+    ranking = ranking or top_bottom_k(df, ['diggCount'], k)
+    return _top_bottom_figure(ranking, 'diggCount', "Likes", "Likes", k)
 
-    return fig_comment
+def comment_analysis(df, k=5, ranking=None):
+    """Analisis video dengan comment tertinggi dan terendah."""
+    ranking = ranking or top_bottom_k(df, ['commentCount'], k)
+    return _top_bottom_figure(ranking, 'commentCount', "comment", "Comments", k)
 
-def share_analysis(df):
+def share_analysis(df, k=5, ranking=None):
     """Analisis video dengan share tertinggi dan terendah."""
-    # =================Top & Bottom Videos by Shares==================
-    # Top 5 shares
-    top_shares = (df.nlargest(5, 'shareCount')[['authorMeta.name', 'shareCount']].sort_values(by='shareCount', ascending=False))
-    top_shares['video_label'] = top_shares['authorMeta.name'] + ' - Vid ' + (top_shares.groupby('authorMeta.name').cumcount() + 1).astype(str)
-
-    # Bottom 5 shares
-    bottom_shares = (df.nsmallest(5, 'shareCount')[['authorMeta.name', 'shareCount']].sort_values(by='shareCount', ascending=False))
-    bottom_shares['video_label'] = bottom_shares['authorMeta.name'] + ' - Vid ' + (bottom_shares.groupby('authorMeta.name').cumcount() + 1).astype(str)
-
-    # Mean
-    mean_shares = df['shareCount'].mean()
-
-    fig_shares = go.Figure()
-
-    # 1
-    fig_shares.add_trace(go.Bar(
-        x=top_shares['video_label'],
-        y=top_shares['shareCount'],
-        name="Top 5 Videos",
-        marker_color="midnightblue",
-        visible=True,
-        text=None
-    ))
-
-    # 2
-    fig_shares.add_trace(go.Scatter(
-        x=[None], y=[None],
-        mode="lines",
-        line=dict(color="orange", dash="dash"),
-        name=f"Mean shares ({mean_shares:.2f})",
-        showlegend=True,
-        visible=True
-    ))
-
-    # 3
-    fig_shares.add_trace(go.Bar(
-        x=bottom_shares['video_label'],
-        y=bottom_shares['shareCount'],
-        name="Bottom 5 Videos",
-        marker_color="midnightblue",
-        visible=False,
-        text=bottom_shares['shareCount'],          
-        textposition='outside'                   
-    ))
-
-    # 4
-    fig_shares.add_trace(go.Scatter(
-        x=[None], y=[None],
-        mode="lines",
-        line=dict(color="orange", dash="dash"),
-        name=f"Mean shares ({mean_shares:.2f})",
-        showlegend=True,
-        visible=False
-    ))
-
-    # ADD HLINE MEAN
-    fig_shares.add_hline(
-        y=mean_shares,
-        line_dash="dash",
-        line_color="orange",
-        annotation_text=f"Mean = {mean_shares:.2f}",
-        annotation_position="top right"
-    )
-
-    # DROPDOWN MENU
-    fig_shares.update_layout(
-        updatemenus=[
-            dict(
-                buttons=[
-                    dict(
-                        label="Top 5 Videos",
-                        method="update",
-                        args=[
-                            {"visible": [True, True, False, False]},
-                            {"title": "Top 5 Videos with Highest shares"}
-                        ]
-                    ),
-                    dict(
-                        label="Bottom 5 Videos",
-                        method="update",
-                        args=[
-                            {"visible": [False, False, True, True]},
-                            {"title": "Bottom 5 Videos with Lowest shares"}
-                        ]
-                    ),
-                ],
-                direction="down",
-                showactive=True,
-                x=0,
-                xanchor="left",
-                y=1.15,
-                yanchor="top"
-            )
-        ]
-    )
+    ranking = ranking or top_bottom_k(df, ['shareCount'], k)
+    return _top_bottom_figure(ranking, 'shareCount', "shares", "Shares", k)
 
-    #   LAYOUT / TITLES
-    fig_shares.update_layout(
-        title=dict(
-            text="Top 5 Videos with Highest shares",
-            x=0.5,
-            xanchor="center"
-        ),
-        xaxis_title="Video Label",
-        yaxis_title="Shares",
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.05,
-            xanchor="right",
-            x=1
-        )
-    )
-
-    return fig_shares
-
-def saved_analysis(df):
+def saved_analysis(df, k=5, ranking=None):
     """Analisis video dengan saved tertinggi dan terendah."""
-    # =================Top & Bottom Videos by Saved==================
-    # Top 5 saved
-    top_saved = (df.nlargest(5, 'collectCount')[['authorMeta.name', 'collectCount']].sort_values(by='collectCount', ascending=False))
-    top_saved['video_label'] = top_saved['authorMeta.name'] + ' - Vid ' + (top_saved.groupby('authorMeta.name').cumcount() + 1).astype(str)
-
-    # Bottom 5 saved
-    bottom_saved = (df.nsmallest(5, 'collectCount')[['authorMeta.name', 'collectCount']].sort_values(by='collectCount', ascending=False))
-    bottom_saved['video_label'] = bottom_saved['authorMeta.name'] + ' - Vid ' + (bottom_saved.groupby('authorMeta.name').cumcount() + 1).astype(str)
-
-    # Mean
-    mean_saved = df['collectCount'].mean()
-
-    fig_saved = go.Figure()
-
-    # 1
-    fig_saved.add_trace(go.Bar(
-        x=top_saved['video_label'],
-        y=top_saved['collectCount'],
-        name="Top 5 Videos",
-        marker_color="midnightblue",
-        visible=True,
-        text=None
-    ))
-
-    # 2
-    fig_saved.add_trace(go.Scatter(
-        x=[None], y=[None],
-        mode="lines",
-        line=dict(color="orange", dash="dash"),
-        name=f"Mean saved ({mean_saved:.2f})",
-        showlegend=True,
-        visible=True
-    ))
-
-    # 3
-    fig_saved.add_trace(go.Bar(
-        x=bottom_saved['video_label'],
-        y=bottom_saved['collectCount'],
-        name="Bottom 5 Videos",
-        marker_color="midnightblue",
-        visible=False,
-        text=bottom_saved['collectCount'],          
-        textposition='outside'                   
-    ))
-
-    # 4
-    fig_saved.add_trace(go.Scatter(
-        x=[None], y=[None],
-        mode="lines",
-        line=dict(color="orange", dash="dash"),
-        name=f"Mean saved ({mean_saved:.2f})",
-        showlegend=True,
-        visible=False
-    ))
-
-    # ADD HLINE MEAN
-    fig_saved.add_hline(
-        y=mean_saved,
-        line_dash="dash",
-        line_color="orange",
-        annotation_text=f"Mean = {mean_saved:.2f}",
-        annotation_position="top right"
-    )
+    ranking = ranking or top_bottom_k(df, ['collectCount'], k)
+    return _top_bottom_figure(ranking, 'collectCount', "saved", "Saved", k)
 
-    # DROPDOWN MENU
-    fig_saved.update_layout(
-        updatemenus=[
-            dict(
-                buttons=[
-                    dict(
-                        label="Top 5 Videos",
-                        method="update",
-                        args=[
-                            {"visible": [True, True, False, False]},
-                            {"title": "Top 5 Videos with Highest saved"}
-                        ]
-                    ),
-                    dict(
-                        label="Bottom 5 Videos",
-                        method="update",
-                        args=[
-                            {"visible": [False, False, True, True]},
-                            {"title": "Bottom 5 Videos with Lowest saved"}
-                        ]
-                    ),
-                ],
-                direction="down",
-                showactive=True,
-                x=0,
-                xanchor="left",
-                y=1.15,
-                yanchor="top"
-            )
-        ]
-    )
-
-    #   LAYOUT / TITLES
-    fig_saved.update_layout(
-        title=dict(
-            text="Top 5 Videos with Highest saved",
-            x=0.5,
-            xanchor="center"
-        ),
-        xaxis_title="Video Label",
-        yaxis_title="Saved",
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.05,
-            xanchor="right",
-            x=1
-        )
-    )
-
-    return fig_saved
-
-def views_analysis(df):
+def views_analysis(df, k=5, ranking=None):
     """Analisis video dengan views tertinggi dan terendah."""
-    # =================Top & Bottom Videos by Views==================
-    # Top 5 views
-    top_views = (df.nlargest(5, 'playCount')[['authorMeta.name', 'playCount']].sort_values(by='playCount', ascending=False))
-    top_views['video_label'] = top_views['authorMeta.name'] + ' - Vid ' + (top_views.groupby('authorMeta.name').cumcount() + 1).astype(str)
-
-    # Bottom 5 views
-    bottom_views = (df.nsmallest(5, 'playCount')[['authorMeta.name', 'playCount']].sort_values(by='playCount', ascending=False))
-    bottom_views['video_label'] = bottom_views['authorMeta.name'] + ' - Vid ' + (bottom_views.groupby('authorMeta.name').cumcount() + 1).astype(str)
-    # Mean
-    mean_views = df['playCount'].mean()
-
-    fig_views = go.Figure()
-
-    # 1
-    fig_views.add_trace(go.Bar(
-        x=top_views['video_label'],
-        y=top_views['playCount'],
-        name="Top 5 Videos",
-        marker_color="midnightblue",
-        visible=True,
-        text=None
-    ))
-
-    # 2
-    fig_views.add_trace(go.Scatter(
-        x=[None], y=[None],
-        mode="lines",
-        line=dict(color="orange", dash="dash"),
-        name=f"Mean views ({mean_views:.2f})",
-        showlegend=True,
-        visible=True
-    ))
-
-    # 3
-    fig_views.add_trace(go.Bar(
-        x=bottom_views['video_label'],
-        y=bottom_views['playCount'],
-        name="Bottom 5 Videos",
-        marker_color="midnightblue",
-        visible=False,
-        text=bottom_views['playCount'],          
-        textposition='outside'                   
-    ))
-
-    # 4
-    fig_views.add_trace(go.Scatter(
-        x=[None], y=[None],
-        mode="lines",
-        line=dict(color="orange", dash="dash"),
-        name=f"Mean views ({mean_views:.2f})",
-        showlegend=True,
-        visible=False
-    ))
-
-    # ADD HLINE MEAN
-    fig_views.add_hline(
-        y=mean_views,
-        line_dash="dash",
-        line_color="orange",
-        annotation_text=f"Mean = {mean_views:.2f}",
-        annotation_position="top right"
-    )
-
-
-    # DROPDOWN MENU
-    fig_views.update_layout(
-        updatemenus=[
-            dict(
-                buttons=[
-                    dict(
-                        label="Top 5 Videos",
-                        method="update",
-                        args=[
-                            {"visible": [True, True, False, False]},
-                            {"title": "Top 5 Videos with Highest views"}
-                        ]
-                    ),
-                    dict(
-                        label="Bottom 5 Videos",
-                        method="update",
-                        args=[
-                            {"visible": [False, False, True, True]},
-                            {"title": "Bottom 5 Videos with Lowest views"}
-                        ]
-                    ),
-                ],
-                direction="down",
-                showactive=True,
-                x=0,
-                xanchor="left",
-                y=1.15,
-                yanchor="top"
-            )
-        ]
-    )
-
-    #   LAYOUT / TITLES
-    fig_views.update_layout(
-        title=dict(
-            text="Top 5 Videos with Highest views",
-            x=0.5,
-            xanchor="center"
-        ),
-        xaxis_title="Video Label",
-        yaxis_title="Views",
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.05,
-            xanchor="right",
-            x=1
-        )
-    )
-
-    return fig_views
+    ranking = ranking or top_bottom_k(df, ['playCount'], k)
+    return _top_bottom_figure(ranking, 'playCount', "views", "Views", k)
 
-def duration_analysis(df):
+def duration_analysis(df, k=5, ranking=None):
     """Analisis video dengan duration tertinggi dan terendah."""
-    # =================Top & Bottom Videos by Duration==================
-    # Top 5 duration
-    top_duration = (df.nlargest(5, 'videoMeta.duration')[['authorMeta.name', 'videoMeta.duration']].sort_values(by='videoMeta.duration', ascending=False))
-    top_duration['video_label'] = top_duration['authorMeta.name'] + ' - Vid ' + (top_duration.groupby('authorMeta.name').cumcount() + 1).astype(str)
-
-    # Bottom 5 duration
-    bottom_duration = (df.nsmallest(5, 'videoMeta.duration')[['authorMeta.name', 'videoMeta.duration']].sort_values(by='videoMeta.duration', ascending=False))
-    bottom_duration['video_label'] = bottom_duration['authorMeta.name'] + ' - Vid ' + (bottom_duration.groupby('authorMeta.name').cumcount() + 1).astype(str)
-    # Mean
-    mean_duration = df['videoMeta.duration'].mean()
-
-    fig_views = go.Figure()
-
-    # 1
-    fig_views.add_trace(go.Bar(
-        x=top_duration['video_label'],
-        y=top_duration['videoMeta.duration'],
-        name="Top 5 Durations",
-        marker_color="midnightblue",
-        visible=True,
-        text=None
-    ))
-
-    # 2
-    fig_views.add_trace(go.Scatter(
-        x=[None], y=[None],
-        mode="lines",
-        line=dict(color="orange", dash="dash"),
-        name=f"Mean duration ({mean_duration:.2f})",
-        showlegend=True,
-        visible=True
-    ))
-
-    # 3
-    fig_views.add_trace(go.Bar(
-        x=bottom_duration['video_label'],
-        y=bottom_duration['videoMeta.duration'],
-        name="Bottom 5 Videos",
-        marker_color="midnightblue",
-        visible=False,
-        text=bottom_duration['videoMeta.duration'],          
-        textposition='outside'                   
-    ))
+    ranking = ranking or top_bottom_k(df, ['videoMeta.duration'], k)
+    return _top_bottom_figure(ranking, 'videoMeta.duration', "duration", "Duration (seconds)", k,
+                              top_name=f"Top {k} Durations")
 
-    # 4
-    fig_views.add_trace(go.Scatter(
-        x=[None], y=[None],
-        mode="lines",
-        line=dict(color="orange", dash="dash"),
-        name=f"Mean duration ({mean_duration:.2f})",
-        showlegend=True,
-        visible=False
-    ))
-
-    # ADD HLINE MEAN
-    fig_views.add_hline(
-        y=mean_duration,
-        line_dash="dash",
-        line_color="orange",
-        annotation_text=f"Mean = {mean_duration:.2f}",
-        annotation_position="top right"
-    )
-
-    # DROPDOWN MENU
-    fig_views.update_layout(
-        updatemenus=[
-            dict(
-                buttons=[
-                    dict(
-                        label="Top 5 Videos",
-                        method="update",
-                        args=[
-                            {"visible": [True, True, False, False]},
-                            {"title": "Top 5 Videos with Highest duration"}
-                        ]
-                    ),
-                    dict(
-                        label="Bottom 5 Videos",
-                        method="update",
-                        args=[
-                            {"visible": [False, False, True, True]},
-                            {"title": "Bottom 5 Videos with Lowest duration"}
-                        ]
-                    ),
-                ],
-                direction="down",
-                showactive=True,
-                x=0,
-                xanchor="left",
-                y=1.15,
-                yanchor="top"
-            )
-        ]
-    )
-
-    #   LAYOUT / TITLES
-    fig_views.update_layout(
-        title=dict(
-            text="Top 5 Videos with Highest duration",
-            x=0.5,
-            xanchor="center"
-        ),
-        xaxis_title="Video Label",
-        yaxis_title="Duration (seconds)",
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.05,
-            xanchor="right",
-            x=1
-        )
-    )
-
-    return fig_views
-
-def videos_over_time(df):
+def videos_over_time(df, buckets=None, max_points=DEFAULT_MAX_POINTS, method='lttb'):
     """Analisis video yang dibuat dari waktu ke waktu."""
     # =================Line Chart of Videos Created Over Time==================
     # Line chart with dropdown menu for different time ranges
-    df['createTimeISO'] = pd.to_datetime(df['createTimeISO'])
-
-    latest_date = df['createTimeISO'].max()
-
-    # Rentang waktu
-    three_month = latest_date - pd.Timedelta(days=90)
-    one_month = latest_date - pd.Timedelta(days=30)
-    one_week  = latest_date - pd.Timedelta(days=7)
-    one_day   = latest_date - pd.Timedelta(days=1)
-
-    # Filter dataset
-    data_all_day = df
-    data_last_3month = df[df['createTimeISO'] >= three_month]
-    data_last_month = df[df['createTimeISO'] >= one_month]
-    data_last_week  = df[df['createTimeISO'] >= one_week]
-    data_last_day   = df[df['createTimeISO'] >= one_day]
-
-    # Resample harian
-    daily_all = data_all_day.resample('D', on='createTimeISO').size().reset_index(name='Total')
-    daily_3month = data_last_3month.resample('D', on='createTimeISO').size().reset_index(name='Total')
-    daily_month = data_last_month.resample('D', on='createTimeISO').size().reset_index(name='Total')
-    daily_week = data_last_week.resample('D', on='createTimeISO').size().reset_index(name='Total')
-    daily_day  = data_last_day.resample('H', on='createTimeISO').size().reset_index(name='Total')
+    # semua rentang waktu diambil dari satu TimeBuckets (df tidak diubah)
+    buckets = buckets or TimeBuckets(df)
+
+    # Resample harian (1 hari terakhir per jam)
+    daily_all = buckets.window(None, 'D').rename(columns={'count': 'Total'})
+    daily_3month = buckets.window(90, 'D').rename(columns={'count': 'Total'})
+    daily_month = buckets.window(30, 'D').rename(columns={'count': 'Total'})
+    daily_week = buckets.window(7, 'D').rename(columns={'count': 'Total'})
+    daily_day  = buckets.window(1, 'h').rename(columns={'count': 'Total'})
 
     # Mean
     mean_all_day  = daily_all['Total'].mean()
@@ -855,13 +281,20 @@ def videos_over_time(df):
     mean_week = daily_week['Total'].mean()
     mean_day = daily_day['Total'].mean()
 
+    # downsampling hanya untuk titik yang digambar (mean tetap dari data penuh)
+    plot_daily_all = downsample_frame(daily_all, 'createTimeISO', 'Total', max_points, method)
+    plot_daily_3month = downsample_frame(daily_3month, 'createTimeISO', 'Total', max_points, method)
+    plot_daily_month = downsample_frame(daily_month, 'createTimeISO', 'Total', max_points, method)
+    plot_daily_week = downsample_frame(daily_week, 'createTimeISO', 'Total', max_points, method)
+    plot_daily_day = downsample_frame(daily_day, 'createTimeISO', 'Total', max_points, method)
+
     # Plot
     fig_lines = go.Figure()
 
     # ALL TIME
     fig_lines.add_trace(go.Scatter(
-        x=daily_all['createTimeISO'],
-        y=daily_all['Total'],
+        x=plot_daily_all['createTimeISO'],
+        y=plot_daily_all['Total'],
         name='All Day',
         visible=True
     ))
@@ -877,8 +310,8 @@ def videos_over_time(df):
 
     # Last 90 DAYS
     fig_lines.add_trace(go.Scatter(
-        x=daily_3month['createTimeISO'],
-        y=daily_3month['Total'],
+        x=plot_daily_3month['createTimeISO'],
+        y=plot_daily_3month['Total'],
         name='Last 90 Days',
         visible=False
     ))
@@ -894,8 +327,8 @@ def videos_over_time(df):
 
     # LAST 30 DAYS
     fig_lines.add_trace(go.Scatter(
-        x=daily_month['createTimeISO'],
-        y=daily_month['Total'],
+        x=plot_daily_month['createTimeISO'],
+        y=plot_daily_month['Total'],
         name='Last 30 Days ',
         visible=False
     ))
@@ -911,8 +344,8 @@ def videos_over_time(df):
 
     # LAST 7 DAYS
     fig_lines.add_trace(go.Scatter(
-        x=daily_week['createTimeISO'],
-        y=daily_week['Total'],
+        x=plot_daily_week['createTimeISO'],
+        y=plot_daily_week['Total'],
         name='Last 7 Days',
         visible=False
     ))
@@ -928,8 +361,8 @@ def videos_over_time(df):
 
     # LAST 1 DAY (jam)
     fig_lines.add_trace(go.Scatter(
-        x=daily_day['createTimeISO'],
-        y=daily_day['Total'],
+        x=plot_daily_day['createTimeISO'],
+        y=plot_daily_day['Total'],
         name='Last 1 Day',
         visible=False
     ))
@@ -973,33 +406,18 @@ def videos_over_time(df):
 
     return fig_lines
 
-def likes_over_time(df):
+def likes_over_time(df, buckets=None, max_points=DEFAULT_MAX_POINTS, method='lttb'):
     """Analisis like video dari waktu ke waktu (Total Likes per periode)."""
 
-    df['createTimeISO'] = pd.to_datetime(df['createTimeISO'])
-
-    # === Tentukan tanggal terakhir ===
-    latest_date = df['createTimeISO'].max()
-
-    # === Rentang waktu ===
-    three_month = latest_date - pd.Timedelta(days=90)
-    one_month  = latest_date - pd.Timedelta(days=30)
-    one_week   = latest_date - pd.Timedelta(days=7)
-    one_day    = latest_date - pd.Timedelta(days=1)
-
-    # === Filter data ===
-    data_all      = df
-    data_90d      = df[df['createTimeISO'] >= three_month]
-    data_30d      = df[df['createTimeISO'] >= one_month]
-    data_7d       = df[df['createTimeISO'] >= one_week]
-    data_1d       = df[df['createTimeISO'] >= one_day]
+    if buckets is None or 'diggCount' not in buckets.metrics:
+        buckets = TimeBuckets(df, ['diggCount'])
 
     # Resample Likes
-    daily_all  = data_all.resample('D', on='createTimeISO')['diggCount'].sum().reset_index(name='Likes')
-    daily_90d  = data_90d.resample('D', on='createTimeISO')['diggCount'].sum().reset_index(name='Likes')
-    daily_30d  = data_30d.resample('D', on='createTimeISO')['diggCount'].sum().reset_index(name='Likes')
-    daily_7d   = data_7d.resample('D', on='createTimeISO')['diggCount'].sum().reset_index(name='Likes')
-    hourly_1d  = data_1d.resample('H', on='createTimeISO')['diggCount'].sum().reset_index(name='Likes')
+    daily_all  = buckets.window(None, 'D').rename(columns={'diggCount': 'Likes'})
+    daily_90d  = buckets.window(90, 'D').rename(columns={'diggCount': 'Likes'})
+    daily_30d  = buckets.window(30, 'D').rename(columns={'diggCount': 'Likes'})
+    daily_7d   = buckets.window(7, 'D').rename(columns={'diggCount': 'Likes'})
+    hourly_1d  = buckets.window(1, 'h').rename(columns={'diggCount': 'Likes'})
 
     # Mean Likes
     mean_all  = daily_all['Likes'].mean()
@@ -1008,12 +426,19 @@ def likes_over_time(df):
     mean_7d   = daily_7d['Likes'].mean() if len(daily_7d) else 0
     mean_1d   = hourly_1d['Likes'].mean() if len(hourly_1d) else 0
 
+    # downsampling hanya untuk titik yang digambar (mean tetap dari data penuh)
+    plot_daily_all = downsample_frame(daily_all, 'createTimeISO', 'Likes', max_points, method)
+    plot_daily_90d = downsample_frame(daily_90d, 'createTimeISO', 'Likes', max_points, method)
+    plot_daily_30d = downsample_frame(daily_30d, 'createTimeISO', 'Likes', max_points, method)
+    plot_daily_7d = downsample_frame(daily_7d, 'createTimeISO', 'Likes', max_points, method)
+    plot_hourly_1d = downsample_frame(hourly_1d, 'createTimeISO', 'Likes', max_points, method)
+
     fig_likes_line = go.Figure()
 
     # ALL TIME
     fig_likes_line.add_trace(go.Scatter(
-        x=daily_all['createTimeISO'],
-        y=daily_all['Likes'],
+        x=plot_daily_all['createTimeISO'],
+        y=plot_daily_all['Likes'],
         name='All Time Likes',
         visible=True
     ))
@@ -1028,8 +453,8 @@ def likes_over_time(df):
 
     # LAST 90 DAYS
     fig_likes_line.add_trace(go.Scatter(
-        x=daily_90d['createTimeISO'],
-        y=daily_90d['Likes'],
+        x=plot_daily_90d['createTimeISO'],
+        y=plot_daily_90d['Likes'],
         name='Last 90 Days Likes',
         visible=False
     ))
@@ -1044,8 +469,8 @@ def likes_over_time(df):
 
     # LAST 30 DAYS
     fig_likes_line.add_trace(go.Scatter(
-        x=daily_30d['createTimeISO'],
-        y=daily_30d['Likes'],
+        x=plot_daily_30d['createTimeISO'],
+        y=plot_daily_30d['Likes'],
         name='Last 30 Days Likes',
         visible=False
     ))
@@ -1060,8 +485,8 @@ def likes_over_time(df):
 
     # LAST 7 DAYS
     fig_likes_line.add_trace(go.Scatter(
-        x=daily_7d['createTimeISO'],
-        y=daily_7d['Likes'],
+        x=plot_daily_7d['createTimeISO'],
+        y=plot_daily_7d['Likes'],
         name='Last 7 Days Likes',
         visible=False
     ))
@@ -1076,8 +501,8 @@ def likes_over_time(df):
 
     # LAST 1 DAY (Hourly)
     fig_likes_line.add_trace(go.Scatter(
-        x=hourly_1d['createTimeISO'],
-        y=hourly_1d['Likes'],
+        x=plot_hourly_1d['createTimeISO'],
+        y=plot_hourly_1d['Likes'],
         name='Last 24 Hours Likes',
         visible=False
     ))
@@ -4,35 +4,69 @@ from collections import Counter
 import networkx as nx
 import plotly.graph_objects as go
 
+from src.anlysis.association import MEASURES, association_measures, check_measure
+from src.anlysis.network_layout import LAYOUT_CACHE, edge_coordinates, node_coordinates
+
+try:
+    from src.anlysis.cooccurrence import hashtag_associations
+except ImportError:  # tanpa scipy: hitung pasangan dengan Counter
+    hashtag_associations = None
+
 # from sentence_transformers import SentenceTransformer
 # from bertopic import BERTopic
 
-def hashtags_association(df, top_n_pairs=30):
-    # buat semua pasangan hashtag
-    hashtag_pairs = [pair for sublist in df["hashtags"] for pair in combinations(sorted(set(sublist)), 2)]
+def count_hashtag_pairs(hashtag_lists, top_n_pairs=30, rank_by='count', min_support=1):
+    check_measure(rank_by)
+    tag_sets = [sorted(set(sublist)) for sublist in hashtag_lists]
+    support = Counter(tag for tags in tag_sets for tag in tags)
+
+    # buat semua pasangan hashtag (hanya hashtag dengan support cukup)
+    hashtag_pairs = [pair for tags in tag_sets
+                     for pair in combinations([t for t in tags if support[t] >= min_support], 2)]
     pair_counts = Counter(hashtag_pairs)
-    df_pairs = pd.DataFrame(pair_counts.items(), columns=['pair','count']).sort_values(by='count', ascending=False)
-    
-    df_top = df_pairs.head(top_n_pairs)
+    df_pairs = pd.DataFrame(pair_counts.items(), columns=['pair','count'])
+    df_pairs = df_pairs[df_pairs['count'] >= min_support]
+
+    measures = association_measures(
+        df_pairs['count'],
+        [support[a] for a, _ in df_pairs['pair']],
+        [support[b] for _, b in df_pairs['pair']],
+        len(tag_sets)
+    )
+    df_pairs = df_pairs.assign(**measures)
+
+    by = [rank_by, 'count', 'pair'] if rank_by != 'count' else ['count', 'pair']
+    df_pairs = df_pairs.sort_values(by=by, ascending=[False] * (len(by) - 1) + [True], kind='stable')
+    return df_pairs.head(top_n_pairs).reset_index(drop=True)
+
+def hashtags_association(df, top_n_pairs=30, rank_by='count', min_support=1, layout_cache=LAYOUT_CACHE,
+                         layout_state=None):
+    """
+    Network & tabel top pasangan hashtag, diurutkan menurut `rank_by`
+    (salah satu MEASURES). `min_support` = minimal jumlah video per hashtag/pasangan.
+    Posisi node diambil dari `layout_cache` (LayoutCache); `layout_state` (dict per
+    sesi) menyimpan layout terakhir untuk warm start.
+    """
+    # co-occurrence lewat matriks sparse video x hashtag (fallback: Counter)
+    if hashtag_associations is not None:
+        df_top = hashtag_associations(df["hashtags"], top_n_pairs, rank_by, min_support)
+    else:
+        df_top = count_hashtag_pairs(df["hashtags"], top_n_pairs, rank_by, min_support)
 
     # buat graph network
     G = nx.Graph()
-    for _, row in df_top.iterrows():
-        G.add_edge(row['pair'][0], row['pair'][1], weight=row['count'])
-    
-    # posisi node
-    pos = nx.spring_layout(G, k=0.5, seed=42)
+    G.add_weighted_edges_from(
+        (a, b, weight) for (a, b), weight in zip(df_top['pair'], df_top[rank_by])
+    )
+
+    # posisi node (di-cache per edge set, warm start dari network sebelumnya di layout_state)
+    previous = layout_state.get("last") if layout_state is not None else None
+    edges, pos = layout_cache.layout(G, k=0.5, seed=42, previous=previous)
+    if layout_state is not None:
+        layout_state["last"] = (edges, pos)
 
     # buat edge traces
-    edge_x = []
-    edge_y = []
-    weights = []
-    for edge in G.edges(data=True):
-        x0, y0 = pos[edge[0]]
-        x1, y1 = pos[edge[1]]
-        edge_x.extend([x0, x1, None])
-        edge_y.extend([y0, y1, None])
-        weights.append(edge[2]['weight'])
+    edge_x, edge_y = edge_coordinates(G, pos)
 
     edge_trace = go.Scatter(
         x=edge_x, y=edge_y,
@@ -42,14 +76,7 @@ def hashtags_association(df, top_n_pairs=30):
     )
 
     # buat node traces
-    node_x = []
-    node_y = []
-    node_text = []
-    for node in G.nodes():
-        x, y = pos[node]
-        node_x.append(x)
-        node_y.append(y)
-        node_text.append(node)
+    node_x, node_y, node_text = node_coordinates(G, pos)
 
     node_trace = go.Scatter(
         x=node_x, y=node_y,
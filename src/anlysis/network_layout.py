@@ -0,0 +1,164 @@
+import threading
+
+from collections import OrderedDict
+
+import numpy as np
+import networkx as nx
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # tanpa scipy: selalu pakai spring_layout networkx
+    cKDTree = None
+
+# di atas jumlah node ini pakai kdtree_layout (O(n log n) per iterasi)
+LARGE_GRAPH_NODES = 500
+# warm start kalau minimal sebagian node ini sudah punya posisi di layout sebelumnya
+WARM_START_OVERLAP = 0.5
+WARM_START_ITERATIONS = 20
+
+def edge_key(G):
+    """Key cache: himpunan edge (tanpa arah) dari graph."""
+    return frozenset(tuple(sorted(edge)) for edge in G.edges())
+
+def _scatter_add(n, index, values):
+    # np.add.at versi cepat untuk array (m, 2)
+    return np.column_stack([np.bincount(index, values[:, 0], minlength=n),
+                            np.bincount(index, values[:, 1], minlength=n)])
+
+def kdtree_layout(G, k=0.5, pos=None, iterations=50, seed=42):
+    """
+    Fruchterman-Reingold dengan cutoff: gaya tolak hanya dihitung antar node
+    dalam radius 2k (dicari dengan KD-tree) sehingga tiap iterasi O(n log n).
+    Posisi di-rescale ke [-1, 1] seperti spring_layout.
+    """
+    nodes = list(G)
+    n = len(nodes)
+    if n == 0:
+        return {}
+
+    # node disebar dengan kepadatan ~1 node per k² supaya tetangga dalam radius sedikit
+    side = k * np.sqrt(n)
+    P = np.random.default_rng(seed).random((n, 2)) * side
+    if pos:
+        # posisi lama ada di [-1, 1], skalakan ke domain yang sama
+        for i, node in enumerate(nodes):
+            if node in pos:
+                P[i] = (np.asarray(pos[node]) + 1) / 2 * side
+
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = np.array([(index[u], index[v]) for u, v in G.edges()], dtype=np.intp).reshape(-1, 2)
+    u, v = edges[:, 0], edges[:, 1]
+
+    t = 0.1 * side
+    dt = t / (iterations + 1)
+    for _ in range(iterations):
+        # tolak: k² / d antar node yang berdekatan
+        pairs = cKDTree(P).query_pairs(2 * k, output_type='ndarray')
+        i, j = pairs[:, 0], pairs[:, 1]
+        delta = P[i] - P[j]
+        dist = np.maximum(np.hypot(delta[:, 0], delta[:, 1]), 0.01)
+        force = delta * (k * k / dist ** 2)[:, None]
+        disp = _scatter_add(n, i, force) - _scatter_add(n, j, force)
+
+        # tarik: d² / k sepanjang edge
+        delta = P[u] - P[v]
+        dist = np.maximum(np.hypot(delta[:, 0], delta[:, 1]), 0.01)
+        force = delta * (dist / k)[:, None]
+        disp += _scatter_add(n, v, force) - _scatter_add(n, u, force)
+
+        # batasi pergeseran dengan temperature yang terus turun
+        length = np.maximum(np.hypot(disp[:, 0], disp[:, 1]), 0.01)
+        P += disp * (np.minimum(length, t) / length)[:, None]
+        t -= dt
+
+    return dict(zip(nodes, nx.rescale_layout(P)))
+
+def _warm_start(G, previous):
+    # posisi awal dari layout sebelumnya; None kalau graph terlalu berbeda
+    if not previous or len(G) == 0:
+        return None
+    init = {node: previous[node] for node in G if node in previous}
+    if len(init) < WARM_START_OVERLAP * len(G):
+        return None
+
+    # node baru ditaruh di rata-rata posisi tetangga yang sudah punya posisi
+    for node in G:
+        if node not in init:
+            known = [init[nb] for nb in G[node] if nb in init]
+            if known:
+                init[node] = np.mean(known, axis=0)
+    return init
+
+def compute_layout(G, k=0.5, seed=42, init=None, large_graph_nodes=LARGE_GRAPH_NODES):
+    """
+    Posisi node (tanpa bobot edge): spring_layout untuk graph kecil, kdtree_layout
+    di atas `large_graph_nodes`. Dengan `init` (posisi awal dari layout graph yang
+    mirip) iterasi lebih sedikit.
+    """
+    iterations = 50 if init is None else WARM_START_ITERATIONS
+    if cKDTree is not None and len(G) > large_graph_nodes:
+        return kdtree_layout(G, k=k, pos=init, iterations=iterations, seed=seed)
+    # bobot (count / PMI / ...) tidak dipakai: nilai negatif bukan gaya tarik yang valid
+    return nx.spring_layout(G, k=k, pos=init, iterations=iterations, seed=seed, weight=None)
+
+class LayoutCache:
+    """
+    Cache posisi node (LRU) per (edge set, k, seed, edge set asal warm start).
+    Layout sebelumnya dikirim pemanggil (mis. per sesi Streamlit), jadi hasil
+    satu graph tidak bergantung pada graph yang terakhir digambar sesi lain.
+    """
+
+    def __init__(self, max_entries=32, large_graph_nodes=LARGE_GRAPH_NODES):
+        self.max_entries = max_entries
+        self.large_graph_nodes = large_graph_nodes
+        self.hits = 0
+        self.misses = 0
+        self._layouts = OrderedDict()
+        self._lock = threading.Lock()
+
+    def layout(self, G, k=0.5, seed=42, previous=None):
+        """
+        Posisi node graph G. `previous` = (edge key, posisi) layout sebelumnya
+        dari pemanggil yang sama untuk warm start. Returns (edge key, posisi).
+        """
+        edges = edge_key(G)
+        init = _warm_start(G, previous[1]) if previous is not None else None
+        origin = previous[0] if init is not None else None
+        key = (edges, k, seed, origin)
+
+        with self._lock:
+            pos = self._layouts.get(key)
+            if pos is not None:
+                self._layouts.move_to_end(key)
+                self.hits += 1
+                return edges, pos
+            self.misses += 1
+
+        pos = compute_layout(G, k=k, seed=seed, init=init, large_graph_nodes=self.large_graph_nodes)
+
+        with self._lock:
+            self._layouts[key] = pos
+            if len(self._layouts) > self.max_entries:
+                self._layouts.popitem(last=False)
+        return edges, pos
+
+# cache bersama untuk semua sesi dalam satu proses
+LAYOUT_CACHE = LayoutCache()
+
+def edge_coordinates(G, pos):
+    """x, y garis semua edge untuk satu trace (x0, x1, NaN per edge)."""
+    edges = list(G.edges())
+    if not edges:
+        return np.array([]), np.array([])
+    start = np.array([pos[u] for u, _ in edges], dtype=np.float64)
+    end = np.array([pos[v] for _, v in edges], dtype=np.float64)
+    gap = np.full(len(edges), np.nan)
+    edge_x = np.column_stack([start[:, 0], end[:, 0], gap]).ravel()
+    edge_y = np.column_stack([start[:, 1], end[:, 1], gap]).ravel()
+    return edge_x, edge_y
+
+def node_coordinates(G, pos):
+    """x, y dan label semua node."""
+    nodes = list(G)
+    coords = np.array([pos[node] for node in nodes], dtype=np.float64).reshape(-1, 2)
+    return coords[:, 0], coords[:, 1], nodes
@@ -0,0 +1,76 @@
+import warnings
+import numpy as np
+import pandas as pd
+
+# metrik yang punya chart top/bottom di halaman Engagement
+METRIC_COLUMNS = ['diggCount', 'commentCount', 'shareCount', 'collectCount', 'playCount', 'videoMeta.duration']
+
+def _select(keys, k):
+    """
+    Posisi k key terkecil (argpartition), tie di batas diambil yang muncul
+    paling awal seperti nlargest/nsmallest(keep='first'). Key inf (NaN) dibuang.
+    """
+    n = len(keys)
+    if n == 0 or k <= 0:
+        return np.array([], dtype=np.intp)
+    if k >= n:
+        selected = np.arange(n)
+    else:
+        kth = keys[np.argpartition(keys, k - 1)[k - 1]]
+        better = np.flatnonzero(keys < kth)
+        ties = np.flatnonzero(keys == kth)[:k - len(better)]
+        selected = np.concatenate([better, ties])
+    return selected[np.isfinite(keys[selected])]
+
+def _video_labels(authors):
+    # "<author> - Vid <n>": nomor urut video author di dalam urutan chart
+    seen = {}
+    labels = []
+    for author in authors:
+        seen[author] = seen.get(author, 0) + 1
+        labels.append(f"{author} - Vid {seen[author]}")
+    return labels
+
+def top_bottom_k(df, metrics=None, k=5):
+    """
+    Top-k dan bottom-k video untuk semua metrik dalam satu pass di matriks NumPy.
+    Returns dict metric -> {'top': DataFrame, 'bottom': DataFrame, 'mean': float};
+    DataFrame berisi kolom `video_label` dan metric, urut nilai tertinggi ke terendah.
+    """
+    metrics = [m for m in (metrics or METRIC_COLUMNS) if m in df.columns]
+    values = df[metrics].to_numpy(dtype='float64', na_value=np.nan)
+    missing = np.isnan(values)
+
+    # key kecil = peringkat atas; NaN -> inf supaya tidak pernah terpilih
+    top_keys = np.where(missing, np.inf, -values)
+    bottom_keys = np.where(missing, np.inf, values)
+    # kolom yang semuanya NaN -> mean NaN tanpa warning (sama seperti Series.mean)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        means = np.nanmean(values, axis=0) if len(values) else np.full(len(metrics), np.nan)
+
+    authors = df['authorMeta.name']
+    result = {}
+    for j, metric in enumerate(metrics):
+        column = df[metric]
+
+        top = _select(top_keys[:, j], k)
+        # urutan chart: nilai turun, tie -> posisi awal dulu
+        top = top[np.lexsort((top, top_keys[top, j]))]
+
+        bottom = _select(bottom_keys[:, j], k)
+        bottom = bottom[np.lexsort((bottom, -values[bottom, j]))]
+
+        result[metric] = {
+            'top': pd.DataFrame({
+                'video_label': _video_labels(authors.iloc[top].astype(str)),
+                metric: column.iloc[top].to_numpy(),
+            }),
+            'bottom': pd.DataFrame({
+                'video_label': _video_labels(authors.iloc[bottom].astype(str)),
+                metric: column.iloc[bottom].to_numpy(),
+            }),
+            'mean': float(means[j]),
+        }
+
+    return result
@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+
+from pandas.api.types import infer_dtype
+
+from plotly import graph_objects as go
+from plotly import io as pio
+
+try:
+    import orjson  # noqa: F401
+    JSON_ENGINE = "orjson"
+except ImportError:  # tanpa orjson: encoder json bawaan plotly
+    JSON_ENGINE = "json"
+
+# trace scatter dengan titik lebih dari ini digambar dengan WebGL
+WEBGL_THRESHOLD = 5000
+
+RENDER_MODES = ('auto', 'svg', 'webgl')
+
+# array pendek (mis. garis mean 2 titik) lebih kecil sebagai JSON biasa
+TYPED_ARRAY_MIN_LENGTH = 32
+
+def _typed_array(values):
+    """
+    List/Series numerik -> numpy array supaya plotly meng-encode sebagai typed
+    array biner (integer tanpa None tetap integer dan diperkecil plotly,
+    None -> NaN float64); tanggal -> epoch ms float64.
+    Returns (array atau nilai asli, apakah tanggal).
+    """
+    if values is None or isinstance(values, str) or len(values) < TYPED_ARRAY_MIN_LENGTH:
+        return values, False
+
+    if isinstance(values, np.ndarray) and values.dtype != object:
+        kind = 'datetime64' if np.issubdtype(values.dtype, np.datetime64) else values.dtype.kind
+    else:
+        kind = infer_dtype(values, skipna=True)
+
+    if kind in ('i', 'u', 'f'):
+        return values, False
+    if kind == 'integer' and not pd.isna(values).any():
+        return np.asarray(values, dtype=np.int64), False
+    if kind in ('integer', 'floating', 'mixed-integer-float', 'empty'):
+        return np.asarray(pd.array(values, dtype='Float64').to_numpy(dtype=np.float64, na_value=np.nan)), False
+    if kind not in ('datetime', 'datetime64'):
+        return values, False
+
+    dates = pd.DatetimeIndex(values)
+    # jam dinding dipertahankan (plotly.js tidak mengenal timezone)
+    if dates.tz is not None:
+        dates = dates.tz_localize(None)
+    ms = dates.asi8.astype(np.float64) / 1e6
+    ms[dates.isna()] = np.nan
+    return ms, True
+
+def _point_count(trace):
+    return max((len(trace[key]) for key in ('x', 'y') if trace.get(key) is not None
+                and not isinstance(trace[key], str)), default=0)
+
+def optimize_figure(fig, render_mode='auto', webgl_threshold=WEBGL_THRESHOLD, typed_arrays=True):
+    """
+    Siapkan figure untuk data besar: x/y jadi typed array biner (tanggal -> epoch ms
+    dengan sumbu bertipe date) dan trace scatter di atas `webgl_threshold` titik
+    diganti Scattergl. render_mode: 'auto', 'svg' (tanpa WebGL) atau 'webgl'.
+    """
+    if render_mode not in RENDER_MODES:
+        raise ValueError(f"render_mode harus salah satu dari {RENDER_MODES}, bukan {render_mode!r}")
+
+    data = []
+    date_axes = set()
+    for trace in fig.data:
+        props = trace.to_plotly_json()
+
+        if typed_arrays:
+            for key in ('x', 'y'):
+                if key in props:
+                    props[key], is_date = _typed_array(props[key])
+                    if is_date:
+                        axis = props.get(f'{key}axis', key)
+                        date_axes.add(axis.replace(key, f'{key}axis', 1))
+
+        if props.get('type') == 'scatter':
+            webgl = render_mode == 'webgl' or (render_mode == 'auto' and _point_count(props) > webgl_threshold)
+            if webgl:
+                props['type'] = 'scattergl'
+
+        data.append(props)
+
+    layout = fig.layout.to_plotly_json()
+    for axis in date_axes:
+        layout.setdefault(axis, {})['type'] = 'date'
+
+    return go.Figure({'data': data, 'layout': layout})
+
+def figure_to_json(fig):
+    """Serialisasi figure dengan encoder JSON tercepat yang tersedia (orjson)."""
+    return pio.to_json(fig, validate=False, engine=JSON_ENGINE)
@@ -0,0 +1,122 @@
+import numpy as np
+import pandas as pd
+
+INTERACTION_COLUMNS = ['diggCount', 'commentCount', 'shareCount', 'collectCount']
+SUM_COLUMNS = INTERACTION_COLUMNS + ['playCount']
+
+def engagement_rate(table):
+    """(likes + comments + shares + saves) / views * 100, inf/NaN -> 0, dibulatkan 2 desimal."""
+    # dijumlah sebagai float: counter disimpan dengan integer kecil (bisa overflow)
+    interactions = table[INTERACTION_COLUMNS].astype('float64').sum(axis=1, min_count=4)
+    rate = interactions / table['playCount'].astype('float64').replace(0, np.nan) * 100
+    return rate.replace([np.inf, -np.inf], np.nan).fillna(0).round(2)
+
+def video_engagement_table(df):
+    """Tabel engagement rate per video, urut dari engagement rate tertinggi."""
+    table = df[['authorMeta.name', 'webVideoUrl'] + SUM_COLUMNS].copy()
+    table['engagement_rate'] = engagement_rate(table)
+    table = table.sort_values(by='engagement_rate', ascending=False).reset_index(drop=True)
+    table["No"] = np.arange(1, len(table) + 1)
+    table["engagement_rate_for_bar"] = table["engagement_rate"].clip(0, 100)
+    return table
+
+def _aggregate(frame, keys):
+    # jumlah video + total counter per key, lalu engagement rate agregat
+    grouped = frame.groupby(keys, observed=True, sort=False)
+    table = grouped[SUM_COLUMNS].sum()
+    table.insert(0, 'videos', grouped.size())
+    table['engagement_rate'] = engagement_rate(table)
+    return table
+
+def _as_counts(table):
+    # total counter dijumlah sebagai float (aman overflow), tampil kembali sebagai integer
+    columns = [c for c in ['videos'] + SUM_COLUMNS if c in table.columns]
+    table[columns] = table[columns].round().astype('int64')
+    return table
+
+class EngagementCube:
+    """
+    Rollup engagement yang dibangun sekali per dataset: tabel author x hari dan
+    hashtag x hari (jumlah video, total counter, engagement rate), plus tabel
+    engagement per video. Chart, tabel dan filter cukup meng-query tabel kecil
+    ini tanpa scan ulang data mentah; `subset` membuat cube untuk sebagian
+    video dari fakta yang sudah disiapkan (tanpa parse tanggal / explode ulang).
+    """
+
+    def __init__(self, df):
+        times = pd.to_datetime(df['createTimeISO'])
+        fact = df[SUM_COLUMNS].astype('float64').reset_index(drop=True)
+        fact['author'] = df['authorMeta.name'].reset_index(drop=True)
+        fact['day'] = times.dt.normalize().reset_index(drop=True)
+        self._fact = fact
+
+        # satu baris per (video, hashtag); hashtag dobel di satu caption dihitung sekali
+        if 'hashtags' in df.columns:
+            tags = df['hashtags'].reset_index(drop=True).explode().dropna()
+        else:
+            tags = pd.Series([], dtype=object)
+        tags = tags[~pd.MultiIndex.from_arrays([tags.index, tags.to_numpy()]).duplicated()]
+        self._tag_rows = tags.index.to_numpy(dtype=np.intp)
+        self._tag_values = tags.to_numpy()
+
+        self._video_columns = df[['authorMeta.name', 'webVideoUrl'] + SUM_COLUMNS].reset_index(drop=True)
+        self._build(np.arange(len(fact)))
+
+    def _build(self, rows):
+        fact = self._fact.iloc[rows]
+        self.by_author_day = _aggregate(fact, ['author', 'day'])
+
+        selected = np.zeros(len(self._fact), dtype=bool)
+        selected[rows] = True
+        keep = selected[self._tag_rows]
+        exploded = self._fact[SUM_COLUMNS + ['day']].iloc[self._tag_rows[keep]]
+        exploded = exploded.assign(hashtag=self._tag_values[keep])
+        self.by_hashtag_day = _aggregate(exploded, ['hashtag', 'day'])
+
+        self.videos = video_engagement_table(self._video_columns.iloc[rows])
+
+    def subset(self, rows):
+        """Cube untuk sebagian video (posisi baris, mis. hasil VideoIndex.query)."""
+        cube = object.__new__(EngagementCube)
+        cube._fact = self._fact
+        cube._tag_rows = self._tag_rows
+        cube._tag_values = self._tag_values
+        cube._video_columns = self._video_columns
+        cube._build(np.asarray(rows, dtype=np.intp))
+        return cube
+
+    @property
+    def day_range(self):
+        """(hari pertama, hari terakhir) di cube, None kalau kosong."""
+        days = self.by_author_day.index.get_level_values('day')
+        if len(days) == 0:
+            return None
+        return days.min(), days.max()
+
+    @staticmethod
+    def _between(table, start=None, end=None):
+        days = table.index.get_level_values('day')
+        mask = np.ones(len(table), dtype=bool)
+        if start is not None:
+            mask &= days >= start
+        if end is not None:
+            mask &= days <= end
+        return table[mask]
+
+    @staticmethod
+    def _rollup(table, level):
+        # gabungkan tabel agregat ke level yang lebih kasar (urut kemunculan dipertahankan)
+        grouped = table.groupby(level=level, observed=True, sort=False)
+        result = grouped[['videos'] + SUM_COLUMNS].sum()
+        result['engagement_rate'] = engagement_rate(result)
+        return _as_counts(result)
+
+    def authors(self, start=None, end=None):
+        """Total per author (opsional rentang hari), urut jumlah video terbanyak."""
+        table = self._rollup(self._between(self.by_author_day, start, end), 'author')
+        return table.sort_values('videos', ascending=False, kind='stable')
+
+    def hashtags(self, start=None, end=None):
+        """Total per hashtag (opsional rentang hari), urut jumlah video terbanyak."""
+        table = self._rollup(self._between(self.by_hashtag_day, start, end), 'hashtag')
+        return table.sort_values('videos', ascending=False, kind='stable')
@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+
+class TimeBuckets:
+    """
+    Agregasi jumlah video dan total metrik per hari / per jam.
+    Timestamp di-sort sekali dan metrik disimpan sebagai prefix sum, jadi
+    setiap trailing window (90d, 30d, ...) cukup diambil dengan slicing,
+    hasilnya sama dengan filter `>= latest - days` lalu `resample`.
+    DataFrame input tidak diubah.
+    """
+
+    def __init__(self, df, metrics=(), time_col='createTimeISO'):
+        self.time_col = time_col
+        self.metrics = list(metrics)
+
+        times = pd.to_datetime(df[time_col])
+        valid = times.notna().to_numpy()
+        times = pd.DatetimeIndex(times[valid])
+        order = np.argsort(times.asi8, kind='stable')
+        self.times = times[order]
+
+        # prefix sum per metrik: total baris [i, j) = cum[j] - cum[i]
+        self._cums = {}
+        for metric in self.metrics:
+            column = df[metric]
+            values = column.to_numpy(dtype='float64', na_value=np.nan)[valid][order]
+            values = np.nan_to_num(values, nan=0.0)
+            if pd.api.types.is_integer_dtype(column.dtype):
+                values = values.astype(np.int64)
+            self._cums[metric] = np.concatenate([np.zeros(1, dtype=values.dtype), np.cumsum(values)])
+
+        self._edges = {}
+
+    @property
+    def latest(self):
+        return self.times[-1] if len(self.times) else pd.NaT
+
+    def _bucket_edges(self, freq):
+        # label bucket + posisi baris pertama tiap bucket (dibuat sekali per frekuensi)
+        if freq not in self._edges:
+            first, last = self.times[0], self.times[-1]
+            start = first.normalize() if freq == 'D' else first.floor(freq)
+            labels = pd.date_range(start, last, freq=freq)
+            bounds = np.append(self.times.searchsorted(labels), len(self.times))
+            self._edges[freq] = (labels, bounds)
+        return self._edges[freq]
+
+    def window(self, days=None, freq='D'):
+        """
+        Bucket untuk data `days` hari terakhir (None = semua data).
+        Returns DataFrame: kolom waktu, `count`, dan total setiap metrik.
+        """
+        columns = [self.time_col, 'count'] + self.metrics
+        if not len(self.times):
+            return pd.DataFrame(columns=columns)
+
+        start = 0
+        if days is not None:
+            start = self.times.searchsorted(self.latest - pd.Timedelta(days=days), side='left')
+
+        labels, bounds = self._bucket_edges(freq)
+        # bucket pertama = bucket yang memuat baris pertama window (sama seperti resample)
+        first = np.searchsorted(bounds, start, side='right') - 1
+        edges = bounds[first:].copy()
+        edges[0] = start
+
+        result = {self.time_col: labels[first:], 'count': np.diff(edges)}
+        for metric, cum in self._cums.items():
+            result[metric] = cum[edges[1:]] - cum[edges[:-1]]
+        return pd.DataFrame(result, columns=columns)
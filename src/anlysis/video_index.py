@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+
+# union posting list yang besar lebih cepat lewat bitmap boolean daripada sort
+_BITMAP_FRACTION = 1 / 32
+
+def _postings(terms, rows, n_rows):
+    """
+    Posting list gaya CSR: vocab (urut kemunculan), offsets dan row id urut
+    (uint32) per term; satu row hanya sekali per term.
+    """
+    codes, vocab = pd.factorize(terms)
+    # key (term, row) diurutkan lalu yang dobel dibuang (hashtag dobel di satu caption)
+    keys = codes.astype(np.int64) * max(n_rows, 1) + rows
+    keys.sort()
+    keys = keys[np.concatenate([[True], keys[1:] != keys[:-1]])] if len(keys) else keys
+    codes, row_ids = np.divmod(keys, max(n_rows, 1))
+    offsets = np.searchsorted(codes, np.arange(len(vocab) + 1))
+    return list(vocab), offsets, row_ids.astype(np.uint32)
+
+class VideoIndex:
+    """
+    Inverted index hashtag/author -> row id (posisi baris) yang urut, supaya
+    filter drill-down tidak perlu scan ulang kolom list hashtags.
+    Dibangun sekali setelah clean_video_df; query AND/OR/NOT lewat `query`.
+    """
+
+    def __init__(self, df):
+        self.n_rows = len(df)
+
+        if 'hashtags' in df.columns:
+            tags = df['hashtags'].reset_index(drop=True).explode().dropna()
+        else:
+            tags = pd.Series([], dtype=object)
+        self._hashtags, self._hashtag_offsets, self._hashtag_rows = _postings(
+            tags.to_numpy(dtype=object), tags.index.to_numpy(dtype=np.int64), self.n_rows
+        )
+
+        if 'authorMeta.name' in df.columns:
+            authors = df['authorMeta.name'].reset_index(drop=True).dropna()
+        else:
+            authors = pd.Series([], dtype=object)
+        self._authors, self._author_offsets, self._author_rows = _postings(
+            authors.to_numpy(dtype=object), authors.index.to_numpy(dtype=np.int64), self.n_rows
+        )
+
+        self._hashtag_codes = {tag: i for i, tag in enumerate(self._hashtags)}
+        self._author_codes = {name: i for i, name in enumerate(self._authors)}
+
+    @staticmethod
+    def _by_frequency(vocab, offsets):
+        order = np.argsort(-np.diff(offsets), kind='stable')
+        return [vocab[i] for i in order]
+
+    @property
+    def hashtags(self):
+        """Semua hashtag, urut dari yang paling banyak videonya."""
+        return self._by_frequency(self._hashtags, self._hashtag_offsets)
+
+    @property
+    def authors(self):
+        """Semua author, urut dari yang paling banyak videonya."""
+        return self._by_frequency(self._authors, self._author_offsets)
+
+    def hashtag_rows(self, tag):
+        """Row id video yang memuat hashtag (boleh ditulis tanpa '#')."""
+        code = self._hashtag_codes.get(tag)
+        if code is None and not str(tag).startswith('#'):
+            code = self._hashtag_codes.get(f'#{tag}')
+        if code is None:
+            return np.array([], dtype=np.uint32)
+        return self._hashtag_rows[self._hashtag_offsets[code]:self._hashtag_offsets[code + 1]]
+
+    def author_rows(self, name):
+        """Row id video milik author."""
+        code = self._author_codes.get(name)
+        if code is None:
+            return np.array([], dtype=np.uint32)
+        return self._author_rows[self._author_offsets[code]:self._author_offsets[code + 1]]
+
+    def _union(self, postings):
+        postings = [p for p in postings if len(p)]
+        if not postings:
+            return np.array([], dtype=np.uint32)
+        if len(postings) == 1:
+            return postings[0]
+        if sum(len(p) for p in postings) >= self.n_rows * _BITMAP_FRACTION:
+            mask = np.zeros(self.n_rows, dtype=bool)
+            for p in postings:
+                mask[p] = True
+            return np.flatnonzero(mask).astype(np.uint32)
+        return np.unique(np.concatenate(postings))
+
+    def query(self, hashtags_all=(), hashtags_any=(), hashtags_none=(), authors=(), authors_none=()):
+        """
+        Row id (urut) video yang memuat SEMUA `hashtags_all` AND minimal satu
+        `hashtags_any` AND milik salah satu `authors`, NOT memuat `hashtags_none`
+        dan NOT milik `authors_none`. Kriteria kosong diabaikan.
+        """
+        # AND: mulai dari posting list terpendek
+        groups = sorted((self.hashtag_rows(tag) for tag in hashtags_all), key=len)
+        if hashtags_any:
+            groups.append(self._union(self.hashtag_rows(tag) for tag in hashtags_any))
+        if authors:
+            groups.append(self._union(self.author_rows(name) for name in authors))
+
+        result = None
+        for rows in groups:
+            result = rows if result is None else np.intersect1d(result, rows, assume_unique=True)
+            if len(result) == 0:
+                return result.astype(np.uint32)
+        if result is None:
+            result = np.arange(self.n_rows, dtype=np.uint32)
+
+        # NOT
+        excluded = self._union([self.hashtag_rows(tag) for tag in hashtags_none]
+                               + [self.author_rows(name) for name in authors_none])
+        if len(excluded):
+            mask = np.ones(self.n_rows, dtype=bool)
+            mask[excluded] = False
+            result = result[mask[result]]
+        return result
+
+    def filter(self, df, **query):
+        """Baris df (yang dipakai membangun index) yang cocok dengan query."""
+        return df.iloc[self.query(**query)]
@@ -0,0 +1,135 @@
+import io
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import plotly.graph_objects as go
+
+from matplotlib.figure import Figure
+from wordcloud import WordCloud, STOPWORDS
+
+# WordCloud hanya menggambar 200 kata teratas (max_words default)
+MAX_WORDS = 200
+# jumlah emoji yang ditampilkan di bar chart emoji
+TOP_EMOJI = 20
+
+def _top_frequencies(tokens, max_words=MAX_WORDS):
+    tokens = tokens.dropna()
+    tokens = tokens[tokens != ""]
+    return tokens.value_counts().head(max_words).to_dict()
+
+def _folded_frequencies(tokens, max_words=MAX_WORDS):
+    """
+    Seperti WordCloud.process_text: STOPWORDS wordcloud dibuang, varian huruf
+    besar/kecil dihitung sebagai satu kata dan ditampilkan dengan ejaan terbanyak.
+    """
+    tokens = tokens.dropna().astype(str)
+    tokens = tokens[tokens != ""]
+    folded = tokens.str.lower()
+    keep = ~folded.isin(STOPWORDS)
+    spellings = pd.DataFrame({
+        "folded": folded[keep].to_numpy(),
+        "token": tokens[keep].to_numpy(),
+    }).value_counts(sort=True)
+    if spellings.empty:
+        return {}
+
+    totals = spellings.groupby(level="folded", sort=False).sum()
+    totals = totals.sort_values(ascending=False, kind="stable").head(max_words)
+    # value_counts sudah urut terbanyak -> baris pertama per kata = ejaan terbanyak
+    best = spellings.reset_index().drop_duplicates("folded").set_index("folded")["token"]
+    return {best[word]: int(count) for word, count in totals.items()}
+
+def caption_frequencies(texts, max_words=MAX_WORDS):
+    """Frekuensi token dari kolom text_clean (sudah bersih, cukup split spasi)."""
+    tokens = pd.Series(texts).dropna().astype(str).str.split().explode()
+    # angka murni diabaikan seperti WordCloud.generate
+    tokens = tokens[~tokens.astype(str).str.isdigit()]
+    return _folded_frequencies(tokens, max_words)
+
+def hashtag_frequencies(hashtag_lists, max_words=MAX_WORDS):
+    """Frekuensi hashtag langsung dari kolom list hashtags (tanpa '#')."""
+    tokens = pd.Series(hashtag_lists).explode().dropna().astype(str).str.lstrip("#")
+    return _folded_frequencies(tokens, max_words)
+
+def emoji_frequencies(emoji_lists, max_words=MAX_WORDS, counts=None):
+    """
+    Frekuensi emoji dari kolom list emoji. `counts` (Counter dari
+    clean_video_df(return_emoji_counts=True)) dipakai langsung kalau ada.
+    """
+    if counts is not None:
+        return dict(counts.most_common(max_words))
+    tokens = pd.Series(emoji_lists).explode().dropna().astype(str).str.strip()
+    return _top_frequencies(tokens, max_words)
+
+def term_frequencies(df, max_words=MAX_WORDS, emoji_counts=None):
+    """
+    Frekuensi caption, hashtag dan emoji untuk generate_from_frequencies.
+    `emoji_counts` hanya boleh diisi kalau masih sesuai dengan baris `df` (tanpa filter).
+    """
+    return {
+        "caption": caption_frequencies(df["text_clean"], max_words),
+        "hashtag": hashtag_frequencies(df["hashtags"], max_words),
+        "emoji": emoji_frequencies(df["emoji"], max_words, emoji_counts),
+    }
+
+def render_wordcloud(frequencies, title):
+    """
+    WordCloud dari dict frekuensi -> PNG (bytes), None kalau tidak ada kata.
+    Pakai Figure (bukan pyplot) supaya aman dijalankan di thread.
+    """
+    if not frequencies:
+        return None
+
+    wc = WordCloud(
+        width=800,
+        height=400,
+        background_color="white",
+        colormap="viridis",
+        max_words=MAX_WORDS
+    ).generate_from_frequencies(frequencies)
+
+    fig = Figure(figsize=(10, 5))
+    ax = fig.subplots()
+    ax.imshow(wc, interpolation="bilinear")
+    ax.set_title(title, fontsize=18)
+    ax.axis("off")
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png")
+    return buffer.getvalue()
+
+def emoji_frequency_figure(frequencies, top_n=TOP_EMOJI):
+    """
+    Bar chart emoji terbanyak. Emoji tidak digambar sebagai wordcloud karena font
+    bawaan WordCloud (DroidSansMono) tidak punya glyph emoji; browser bisa.
+    Returns None kalau tidak ada emoji.
+    """
+    if not frequencies:
+        return None
+
+    top = sorted(frequencies.items(), key=lambda item: item[1], reverse=True)[:top_n]
+    fig = go.Figure(go.Bar(
+        x=[emoji for emoji, _ in top],
+        y=[count for _, count in top],
+        marker_color="midnightblue",
+        text=[count for _, count in top],
+        textposition='outside'
+    ))
+    fig.update_layout(
+        title=None,
+        xaxis=dict(title=None, tickfont=dict(size=22)),
+        yaxis_title="Jumlah kemunculan",
+        plot_bgcolor='white'
+    )
+    return fig
+
+def render_wordclouds(clouds, max_workers=3):
+    """
+    Render beberapa wordcloud sekaligus di thread pool.
+    clouds = {name: (frequencies, title)} -> {name: PNG bytes atau None}.
+    """
+    names = list(clouds)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        images = pool.map(lambda name: render_wordcloud(*clouds[name]), names)
+        return dict(zip(names, images))
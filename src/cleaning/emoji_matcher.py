@@ -0,0 +1,135 @@
+import re
+import emoji
+import pandas as pd
+
+from collections import Counter
+from functools import lru_cache
+
+_ZWJ = "\u200d"
+_VS16 = "\ufe0f"
+_END = ""
+
+def _char_ranges(chars, gap=64):
+    # charset astral (> U+FFFF) di-compile sre sebagai daftar literal yang discan linear;
+    # gabungkan jadi beberapa range kasar (superset, false positive ditolak trie)
+    codes = sorted(ord(c) for c in chars)
+    ranges = []
+    for code in codes:
+        if ranges and code - ranges[-1][1] <= gap:
+            ranges[-1][1] = code
+        else:
+            ranges.append([code, code])
+    return "".join(re.escape(chr(a)) if a == b else f"{re.escape(chr(a))}-{re.escape(chr(b))}"
+                   for a, b in ranges)
+
+class EmojiMatcher:
+    """
+    Automaton (trie) dari emoji.EMOJI_DATA yang mencocokkan sequence emoji
+    terpanjang, termasuk ZWJ sequence dan skin tone, dalam satu pass.
+    Posisi kandidat dicari dengan regex charset sehingga teks biasa dilewati di C.
+    """
+
+    def __init__(self, emoji_data=None):
+        emoji_data = emoji.EMOJI_DATA if emoji_data is None else emoji_data
+
+        self._trie = {}
+        for seq in emoji_data:
+            node = self._trie
+            for ch in seq:
+                node = node.setdefault(ch, {})
+            node[_END] = True
+
+        # regex "run" kandidat emoji: teks biasa dilewati di C, hanya run yang
+        # dipecah trie di Python. ASCII (#, *, 0-9) hanya kandidat kalau diikuti VS16 / keycap
+        first_chars = {seq[0] for seq in emoji_data if not seq[0].isascii()}
+        all_chars = {ch for seq in emoji_data for ch in seq if not ch.isascii()}
+        self._run = re.compile(
+            f"(?:[{_char_ranges(first_chars)}]|[#*0-9](?=[\ufe0f\u20e3]))[{_char_ranges(all_chars)}]*"
+        )
+
+    def _match_one(self, text, i):
+        # longest match dari posisi i, None kalau tidak ada
+        node = self._trie
+        last = None
+        n = len(text)
+        while i < n:
+            node = node.get(text[i])
+            if node is None:
+                break
+            i += 1
+            if _END in node:
+                last = i
+        return last
+
+    def _match_sequence(self, text, i):
+        end = self._match_one(text, i)
+        if end is None:
+            return None
+
+        n = len(text)
+        while True:
+            if end < n and text[end] == _VS16:
+                end += 1
+            if end < n and text[end] == _ZWJ:
+                nxt = self._match_one(text, end + 1)
+                if nxt is not None:
+                    end = nxt
+                    continue
+            return end
+
+    def _scan_run(self, run, replace, found):
+        # pecah satu run kandidat menjadi sequence emoji (longest match)
+        parts = []
+        i = 0
+        n = len(run)
+        while i < n:
+            end = self._match_sequence(run, i)
+            if end is None:
+                parts.append(run[i])
+                i += 1
+            else:
+                parts.append(replace)
+                found.append(run[i:end])
+                i = end
+        return "".join(parts)
+
+    def split(self, text, replace=" "):
+        """Satu pass: returns (teks dengan emoji diganti `replace`, list sequence emoji)."""
+        found = []
+        stripped = self._run.sub(lambda m: self._scan_run(m.group(), replace, found), text)
+        return stripped, found
+
+    def findall(self, text):
+        return self.split(text)[1]
+
+@lru_cache(maxsize=None)
+def get_emoji_matcher():
+    """Matcher dibangun sekali per proses."""
+    return EmojiMatcher()
+
+def extract_emoji_column(texts, strip=False):
+    """
+    Ambil sequence emoji dari seluruh kolom caption.
+    Returns (Series list emoji per baris, Counter frekuensi global);
+    jika strip=True juga Series teks tanpa emoji.
+    """
+    matcher = get_emoji_matcher()
+    texts = pd.Series(texts)
+
+    lists = []
+    stripped = []
+    counts = Counter()
+    for text in texts.tolist():
+        if not isinstance(text, str):
+            lists.append([])
+            stripped.append(text)
+            continue
+        clean, found = matcher.split(text)
+        lists.append(found)
+        stripped.append(clean)
+        counts.update(found)
+
+    lists = pd.Series(lists, index=texts.index, dtype=object)
+    if strip:
+        return lists, counts, pd.Series(stripped, index=texts.index, dtype=object)
+    return lists, counts
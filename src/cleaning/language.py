@@ -0,0 +1,104 @@
+import math
+
+from collections import Counter
+from functools import lru_cache
+from src.cleaning import resources
+
+LANGUAGES = ('id', 'en')
+DEFAULT_LANGUAGE = 'id'
+
+# teks contoh gaya caption TikTok untuk profil n-gram (lokal, tanpa network);
+# ditambah daftar stopwords NLTK masing-masing bahasa saat model dibangun
+SEED_TEXT = {
+    'id': (
+        "aku kamu dia kita kami mereka yang dan di ke dari ini itu dengan untuk tidak sudah belum "
+        "akan bisa ada juga karena jadi lagi banget sih deh dong kok gak nggak enggak udah aja "
+        "gimana kenapa makan minum jalan jalan rumah kerja sekolah kuliah teman keluarga hari malam "
+        "pagi siang sore cantik bagus murah mahal enak lucu seru capek senang sedih beli jual "
+        "cobain review jujur rekomendasi tempat makanan minuman kulit wajah rambut baju celana "
+        "sepatu harga diskon promo gratis ongkir mantap keren parah sumpah kangen sayang pengen "
+        "nyobain akhirnya ternyata beneran gampang susah pedas manis gurih kenyang lapar masak "
+        "resep bahan sendiri bareng semua orang anak ibu bapak kakak adik pacar suami istri"
+    ),
+    'en': (
+        "the and is are was were be been have has had do does did not you your we they this that "
+        "these those with for from about what when where which who how why can could would should "
+        "will just really very so too much many more most like love good great best bad new old "
+        "make made get got go going come look see watch try buy sell price free today tonight "
+        "morning night day week life food skin hair face outfit shoes bag review recommend "
+        "favorite amazing beautiful cute funny happy sad tired everyone people friends family "
+        "thing things something nothing always never ever again first last time little big "
+        "follow part story video because little bit sure right here there every"
+    ),
+}
+
+def _ngrams(token, n):
+    padded = f" {token} "
+    return [padded[i:i + n] for i in range(len(padded) - n + 1)]
+
+class NgramLanguageModel:
+    """
+    Naive Bayes karakter n-gram sederhana. Skor per token di-memo sehingga
+    deteksi satu kolom hanya menghitung n-gram untuk setiap token unik sekali.
+    """
+
+    def __init__(self, texts_by_language, n=3):
+        self.n = n
+        self.languages = tuple(texts_by_language)
+
+        counts = {lang: Counter() for lang in self.languages}
+        for lang, words in texts_by_language.items():
+            for word in words:
+                counts[lang].update(_ngrams(word, n))
+
+        vocab_size = len(set().union(*counts.values())) or 1
+        self._log_prob = {}
+        self._unseen = {}
+        for lang in self.languages:
+            total = sum(counts[lang].values()) + vocab_size
+            self._log_prob[lang] = {g: math.log((c + 1) / total) for g, c in counts[lang].items()}
+            self._unseen[lang] = math.log(1 / total)
+
+        self._token_scores = {}
+
+    def token_scores(self, token):
+        scores = self._token_scores.get(token)
+        if scores is None:
+            grams = _ngrams(token, self.n)
+            scores = tuple(
+                sum(self._log_prob[lang].get(g, self._unseen[lang]) for g in grams)
+                for lang in self.languages
+            )
+            self._token_scores[token] = scores
+        return scores
+
+    def detect_tokens(self, tokens, default=DEFAULT_LANGUAGE):
+        if not tokens:
+            return default
+
+        totals = [0.0] * len(self.languages)
+        for token in tokens:
+            for i, score in enumerate(self.token_scores(token)):
+                totals[i] += score
+
+        best = max(range(len(totals)), key=totals.__getitem__)
+        # seri -> bahasa default
+        if totals.count(totals[best]) > 1:
+            return default
+        return self.languages[best]
+
+@lru_cache(maxsize=None)
+def get_language_model():
+    """Model dibangun sekali per proses dari SEED_TEXT + stopwords NLTK."""
+    stopwords = resources.get("stopwords")
+    corpus_names = {'id': 'indonesian', 'en': 'english'}
+    texts = {
+        lang: SEED_TEXT[lang].split() + list(stopwords.words(corpus_names[lang]))
+        for lang in LANGUAGES
+    }
+    return NgramLanguageModel(texts)
+
+def detect_languages(token_lists, default=DEFAULT_LANGUAGE):
+    """Deteksi bahasa untuk banyak caption sekaligus (list token per caption)."""
+    model = get_language_model()
+    return [model.detect_tokens(tokens, default) for tokens in token_lists]
@@ -0,0 +1,149 @@
+import numpy as np
+import pandas as pd
+
+# prime Mersenne 2^31 - 1: a * x + b tetap muat di uint64 untuk x, a, b < P
+_MERSENNE_PRIME = np.uint64((1 << 31) - 1)
+_MAX_HASH = np.uint64((1 << 31) - 2)
+
+# batas elemen matriks hash per chunk permutasi (~32 MB uint64)
+_HASH_CHUNK = 4_000_000
+
+def _shingles(text, shingle_size):
+    # shingle = n-gram kata; caption yang lebih pendek dari n dipakai utuh
+    tokens = text.split()
+    if len(tokens) <= shingle_size:
+        return {" ".join(tokens)} if tokens else set()
+    return {" ".join(tokens[i:i + shingle_size]) for i in range(len(tokens) - shingle_size + 1)}
+
+def _lsh_params(threshold, num_perm):
+    """
+    Pilih (band, row) dengan b * r <= num_perm yang titik belok kurva S
+    (1/b)^(1/r) paling dekat ke threshold.
+    """
+    best = None
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        error = abs((1 / bands) ** (1 / rows) - threshold)
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+def minhash_signatures(texts, num_perm=128, shingle_size=2, seed=42):
+    """
+    Signature MinHash (num_perm nilai) untuk setiap teks.
+    Returns (matriks uint64 [n_teks, num_perm], mask teks yang punya shingle).
+    """
+    vocab = {}
+    ids = []
+    offsets = []
+    has_shingles = np.zeros(len(texts), dtype=bool)
+    for i, text in enumerate(texts):
+        shingles = _shingles(text, shingle_size) if isinstance(text, str) else set()
+        if not shingles:
+            continue
+        has_shingles[i] = True
+        offsets.append(len(ids))
+        ids.extend(vocab.setdefault(s, len(vocab)) for s in shingles)
+
+    signatures = np.full((len(texts), num_perm), _MAX_HASH, dtype=np.uint64)
+    if not ids:
+        return signatures, has_shingles
+
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+    b = rng.integers(0, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+
+    ids = np.asarray(ids, dtype=np.uint64)
+    offsets = np.asarray(offsets, dtype=np.intp)
+    rows = np.flatnonzero(has_shingles)
+
+    # hash semua shingle sekaligus per chunk permutasi, min per dokumen lewat reduceat
+    step = max(1, _HASH_CHUNK // len(ids))
+    for start in range(0, num_perm, step):
+        stop = min(start + step, num_perm)
+        hashed = (a[start:stop, None] * ids[None, :] + b[start:stop, None]) % _MERSENNE_PRIME
+        signatures[rows, start:stop] = np.minimum.reduceat(hashed, offsets, axis=1).T
+
+    return signatures, has_shingles
+
+def _find(parent, i):
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+def near_duplicate_groups(texts, threshold=0.8, num_perm=128, shingle_size=2, seed=42):
+    """
+    Kelompokkan teks yang mirip (estimasi Jaccard shingle >= threshold) dengan
+    MinHash + LSH banding, tanpa membandingkan semua pasangan.
+    Returns array posisi baris pertama kelompok untuk setiap baris
+    (baris yang unik menunjuk ke dirinya sendiri).
+    """
+    texts = pd.Series(texts)
+    # teks identik cukup diproses sekali
+    codes, uniques = pd.factorize(texts)
+    n = len(uniques)
+
+    parent = list(range(n))
+    signatures, has_shingles = minhash_signatures(list(uniques), num_perm, shingle_size, seed)
+    candidates = np.flatnonzero(has_shingles)
+
+    if len(candidates) > 1:
+        bands, rows = _lsh_params(threshold, num_perm)
+        sig = signatures[candidates]
+
+        for band in range(bands):
+            block = np.ascontiguousarray(sig[:, band * rows:(band + 1) * rows])
+            _, bucket = np.unique(block.view(np.dtype((np.void, block.dtype.itemsize * rows))),
+                                  return_inverse=True)
+            bucket = bucket.ravel()
+
+            # setiap anggota bucket diverifikasi terhadap anggota pertama bucket
+            order = np.argsort(bucket, kind="stable")
+            sorted_bucket = bucket[order]
+            first = np.r_[True, sorted_bucket[1:] != sorted_bucket[:-1]]
+            leader = order[np.maximum.accumulate(np.where(first, np.arange(len(order)), 0))]
+
+            members = order[~first]
+            leaders = leader[~first]
+            if len(members) == 0:
+                continue
+
+            similarity = (sig[members] == sig[leaders]).mean(axis=1)
+            for m, l in zip(candidates[members[similarity >= threshold]],
+                            candidates[leaders[similarity >= threshold]]):
+                root_m, root_l = _find(parent, m), _find(parent, l)
+                if root_m != root_l:
+                    parent[max(root_m, root_l)] = min(root_m, root_l)
+
+    roots = np.array([_find(parent, i) for i in range(n)], dtype=np.intp)
+
+    # root (index teks unik) -> posisi baris pertama yang memakai teks itu
+    first_row = np.full(n, -1, dtype=np.intp)
+    valid = codes >= 0
+    seen, positions = np.unique(codes[valid], return_index=True)
+    first_row[seen] = np.flatnonzero(valid)[positions]
+
+    # root = index unik terkecil = teks yang muncul paling awal di kelompoknya;
+    # caption kosong / NaN selalu jadi kelompok sendiri
+    groups = np.arange(len(texts), dtype=np.intp)
+    valid &= has_shingles[np.maximum(codes, 0)]
+    groups[valid] = first_row[roots[codes[valid]]]
+    return groups
+
+def mark_near_duplicates(df, column='text_clean', threshold=0.8, **kwargs):
+    """
+    Tambah kolom `dup_group` (posisi baris pertama kelompoknya) dan
+    `is_near_duplicate` (True untuk semua baris selain baris pertama).
+    Caption kosong tidak pernah dianggap duplikat.
+    """
+    df = df.copy()
+    groups = near_duplicate_groups(df[column], threshold=threshold, **kwargs)
+    df['dup_group'] = groups
+    df['is_near_duplicate'] = groups != np.arange(len(df))
+    return df
+
+def collapse_near_duplicates(df, column='text_clean', threshold=0.8, **kwargs):
+    """Sisakan satu video (yang pertama) per kelompok caption yang mirip."""
+    groups = near_duplicate_groups(df[column], threshold=threshold, **kwargs)
+    return df[groups == np.arange(len(df))].reset_index(drop=True)
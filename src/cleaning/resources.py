@@ -0,0 +1,60 @@
+import threading
+import warnings
+
+# registry resource berat (stemmer, corpus NLTK) yang dibuat saat pertama kali dipakai
+_factories = {}
+_instances = {}
+_lock = threading.RLock()
+
+def register(name, factory):
+    """Daftarkan factory resource tanpa langsung membuatnya."""
+    _factories[name] = factory
+
+def get(name):
+    """Ambil resource; dibuat sekali per proses saat pertama kali diminta."""
+    try:
+        return _instances[name]
+    except KeyError:
+        pass
+
+    with _lock:
+        if name not in _instances:
+            _instances[name] = _factories[name]()
+        return _instances[name]
+
+def loaded():
+    """Nama resource yang sudah dibuat di proses ini."""
+    return list(_instances)
+
+def _sastrawi_stemmer():
+    from Sastrawi.Stemmer.StemmerFactory import StemmerFactory
+    return StemmerFactory().create_stemmer()
+
+def _porter_stemmer():
+    from nltk.stem import PorterStemmer
+    return PorterStemmer()
+
+def _wordnet_lemmatizer():
+    # corpus wordnet opsional (nltk.download("wordnet")); tanpa corpus -> None
+    # dan caption Inggris cukup di-stem Porter
+    import nltk
+    from nltk.stem import WordNetLemmatizer
+    try:
+        nltk.data.find("corpora/wordnet")
+    except LookupError:
+        warnings.warn(
+            "NLTK corpus 'wordnet' tidak ditemukan; caption bahasa Inggris hanya di-stem "
+            "dengan Porter. Jalankan nltk.download('wordnet') untuk lemmatization.",
+            RuntimeWarning
+        )
+        return None
+    return WordNetLemmatizer()
+
+def _stopwords_corpus():
+    from nltk.corpus import stopwords
+    return stopwords
+
+register("sastrawi_stemmer", _sastrawi_stemmer)
+register("porter_stemmer", _porter_stemmer)
+register("wordnet_lemmatizer", _wordnet_lemmatizer)
+register("stopwords", _stopwords_corpus)
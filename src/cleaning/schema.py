@@ -0,0 +1,95 @@
+import hashlib
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:  # tanpa pyarrow: string & list tetap dtype bawaan
+    pa = None
+
+CATEGORY_COLUMNS = ['authorMeta.name', 'language']
+COUNTER_COLUMNS = ['diggCount', 'shareCount', 'playCount', 'commentCount', 'collectCount', 'videoMeta.duration']
+STRING_COLUMNS = ['text', 'text_clean', 'webVideoUrl']
+LIST_COLUMNS = ['hashtags', 'emoji', 'sourceHashtag']
+# kolom list turunan kolom text (tidak perlu ikut fingerprint)
+DERIVED_LIST_COLUMNS = ['hashtags', 'emoji']
+
+_UNSIGNED = [np.uint8, np.uint16, np.uint32, np.uint64]
+_SIGNED = [np.int8, np.int16, np.int32, np.int64]
+
+def _smallest_int(series):
+    # tipe integer terkecil yang muat min/max; nullable (UInt8, Int16, ...) kalau ada NaN
+    values = series.dropna()
+    if values.empty or not np.all(np.mod(values, 1) == 0):
+        return None
+
+    lo, hi = values.min(), values.max()
+    candidates = _UNSIGNED if lo >= 0 else _SIGNED
+    for dtype in candidates:
+        info = np.iinfo(dtype)
+        if info.min <= lo and hi <= info.max:
+            if series.isna().any():
+                name = np.dtype(dtype).name
+                return pd.api.types.pandas_dtype(name.replace("uint", "UInt") if name.startswith("u") else name.capitalize())
+            return np.dtype(dtype)
+    return None
+
+def _memory(df):
+    return int(df.memory_usage(deep=True).sum())
+
+def compact_video_df(df, return_report=False):
+    """
+    Ubah DataFrame hasil clean_video_df ke schema yang hemat memori:
+    author -> category, counter -> integer terkecil yang aman,
+    URL & caption -> Arrow string, list hashtag/emoji -> Arrow list (offset-encoded).
+    """
+    before = _memory(df)
+    df = df.copy()
+
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            # urutan kategori = urutan kemunculan, supaya urutan tie di value_counts tidak berubah
+            df[col] = pd.Categorical(df[col], categories=df[col].dropna().unique())
+
+    for col in COUNTER_COLUMNS:
+        if col in df.columns:
+            dtype = _smallest_int(df[col])
+            if dtype is not None:
+                df[col] = df[col].astype(dtype)
+
+    if pa is not None:
+        for col in STRING_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype(pd.StringDtype("pyarrow"))
+
+        list_dtype = pd.ArrowDtype(pa.list_(pa.string()))
+        for col in LIST_COLUMNS:
+            if col in df.columns:
+                df[col] = pd.Series([list(v) for v in df[col]], index=df.index, dtype=list_dtype)
+
+    if not return_report:
+        return df
+
+    after = _memory(df)
+    report = {
+        'bytes_before': before,
+        'bytes_after': after,
+        'ratio': before / after if after else 0.0,
+        'dtypes': df.dtypes.astype(str).to_dict(),
+    }
+    return df, report
+
+def dataset_fingerprint(df):
+    """
+    Fingerprint isi DataFrame (shape, kolom, dtype, nilai) untuk key cache.
+    Kolom list hashtags/emoji dilewati: isinya turunan dari kolom text yang sudah ikut di-hash.
+    """
+    h = hashlib.sha1()
+    h.update(repr((df.shape, list(df.columns), df.dtypes.astype(str).tolist())).encode())
+    hashable = [c for c in df.columns if c not in LIST_COLUMNS]
+    h.update(pd.util.hash_pandas_object(df[hashable], index=True).to_numpy().tobytes())
+    for col in LIST_COLUMNS:
+        if col in df.columns and col not in DERIVED_LIST_COLUMNS:
+            joined = pd.Series([",".join(v) for v in df[col]], index=df.index)
+            h.update(pd.util.hash_pandas_object(joined, index=False).to_numpy().tobytes())
+    return h.hexdigest()
@@ -0,0 +1,146 @@
+import os
+import sqlite3
+import threading
+
+from collections import OrderedDict
+from importlib import metadata
+
+DEFAULT_STEM_DB = os.path.join(os.path.expanduser("~"), ".cache", "tiktok_analytics", "stems.sqlite3")
+
+# batas jumlah parameter per query sqlite
+_SQL_CHUNK = 500
+
+def stemmer_namespace(language, package):
+    """Key namespace cache: bahasa + nama & versi library stemmer."""
+    try:
+        version = metadata.version(package)
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+    return f"{language}:{package}:{version}"
+
+class StemCache:
+    """
+    Memoization token -> stem: LRU di memori, di-backup sqlite di disk supaya
+    bisa dipakai ulang antar sesi dan antar proses.
+    """
+
+    def __init__(self, db_path=DEFAULT_STEM_DB, max_size=200_000, write_back=True):
+        # write_back=False (mis. di worker process): sqlite hanya dibaca, stem baru
+        # dikumpulkan lewat take_unsaved() dan disimpan oleh proses induk
+        self.db_path = db_path
+        self.max_size = max_size
+        self.write_back = write_back
+        self._unsaved = []
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+
+    def _connection(self):
+        # koneksi sqlite tidak boleh dibawa lewat fork, buka ulang per proses
+        if self._conn is None or self._pid != os.getpid():
+            if self.db_path != ":memory:":
+                os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS stems ("
+                "namespace TEXT NOT NULL, token TEXT NOT NULL, stem TEXT NOT NULL, "
+                "PRIMARY KEY (namespace, token))"
+            )
+            self._pid = os.getpid()
+        return self._conn
+
+    def _remember(self, key, stem):
+        self._memory[key] = stem
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.max_size:
+            self._memory.popitem(last=False)
+
+    def stem_many(self, tokens, namespace, stem_func):
+        """
+        Stem sekumpulan token; setiap token unik hanya di-stem sekali.
+        Returns dict token -> stem.
+        """
+        result = {}
+        pending = []
+
+        with self._lock:
+            for token in set(tokens):
+                key = (namespace, token)
+                stem = self._memory.get(key)
+                if stem is None:
+                    pending.append(token)
+                else:
+                    self._memory.move_to_end(key)
+                    result[token] = stem
+            self.memory_hits += len(result)
+
+            if not pending:
+                return result
+
+            conn = self._connection()
+            found = {}
+            for i in range(0, len(pending), _SQL_CHUNK):
+                chunk = pending[i:i + _SQL_CHUNK]
+                rows = conn.execute(
+                    f"SELECT token, stem FROM stems WHERE namespace = ? "
+                    f"AND token IN ({','.join('?' * len(chunk))})",
+                    [namespace, *chunk]
+                )
+                found.update(rows)
+            self.disk_hits += len(found)
+
+        missing = [t for t in pending if t not in found]
+        computed = {t: stem_func(t) for t in missing}
+
+        with self._lock:
+            self.misses += len(missing)
+            items = [(namespace, t, s) for t, s in computed.items()]
+            if items and self.write_back:
+                self._insert(items)
+            elif items:
+                self._unsaved.extend(items)
+
+            for token, stem in {**found, **computed}.items():
+                self._remember((namespace, token), stem)
+                result[token] = stem
+
+        return result
+
+    def _insert(self, items):
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO stems (namespace, token, stem) VALUES (?, ?, ?)",
+                items
+            )
+
+    def take_unsaved(self):
+        """Stem baru yang belum ditulis ke disk (write_back=False), lalu dikosongkan."""
+        with self._lock:
+            items, self._unsaved = self._unsaved, []
+        return items
+
+    def store_many(self, items):
+        """Simpan (namespace, token, stem) dari proses lain ke memori & sqlite."""
+        items = list(items)
+        if not items:
+            return
+        with self._lock:
+            self._insert(items)
+            for namespace, token, stem in items:
+                self._remember((namespace, token), stem)
+
+    def stats(self):
+        with self._lock:
+            total = self.memory_hits + self.disk_hits + self.misses
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": (self.memory_hits + self.disk_hits) / total if total else 0.0,
+                "memory_size": len(self._memory),
+            }
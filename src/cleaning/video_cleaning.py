@@ -1,33 +1,94 @@
+import os
 import re
+import multiprocessing as mp
+import numpy as np
 import pandas as pd
-import emoji
 
-from nltk.corpus import stopwords
-from nltk.stem import WordNetLemmatizer, PorterStemmer
-from Sastrawi.Stemmer.StemmerFactory import StemmerFactory
-
-STOPWORDS = set(stopwords.words("indonesian"))
-
-# stemmer
-factory = StemmerFactory()
-stemmer = factory.create_stemmer()
+from collections import Counter
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from src.cleaning import resources
+from src.cleaning.stem_cache import StemCache, stemmer_namespace, DEFAULT_STEM_DB
+from src.cleaning.emoji_matcher import get_emoji_matcher
+from src.cleaning.near_duplicates import mark_near_duplicates, collapse_near_duplicates
+from src.cleaning.language import detect_languages, get_language_model, DEFAULT_LANGUAGE
 
 def extract_hashtags(text):
     return re.findall(r"#\w+", text)
 
 def extract_emoji(text):
-    return [c for c in text if c in emoji.EMOJI_DATA]
+    # sequence utuh (ZWJ, skin tone, keycap), bukan per karakter
+    return get_emoji_matcher().findall(text)
 
-# inisialisasi stemmer dan lemmatizer
-porter = PorterStemmer()
-lemmatizer = WordNetLemmatizer()
-factory = StemmerFactory()
-sastrawi_stemmer = factory.create_stemmer()
+# stemmer, lemmatizer dan corpus stopwords dibuat lazy lewat src.cleaning.resources;
+# nama lama tetap bisa diakses sebagai atribut modul
+_LAZY_ATTRS = {
+    'stemmer': lambda: resources.get("sastrawi_stemmer"),
+    'sastrawi_stemmer': lambda: resources.get("sastrawi_stemmer"),
+    'porter': lambda: resources.get("porter_stemmer"),
+    'lemmatizer': lambda: resources.get("wordnet_lemmatizer"),
+    'STOPWORDS': lambda: set(resources.get("stopwords").words("indonesian")),
+}
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        return _LAZY_ATTRS[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # custom stopwords (bisa ditambah sesuai kebutuhan)
 CUSTOM_STOPWORDS_ID = set(['yg','dgn','dr','ke','di','tdk','nih', 'njir', 'dong', 'duh'])
 CUSTOM_STOPWORDS_EN = set(['u','ur','im','ive','lol'])
 
+# kolom hasil scraping yang dipakai clean_video_df
+COLUMNS_NEEDED = [
+    'authorMeta.name',
+    'text',
+    'diggCount',
+    'shareCount',
+    'playCount',
+    'commentCount',
+    'collectCount',
+    'videoMeta.duration',
+    'createTimeISO',
+    'webVideoUrl'
+]
+
+# kolom hasil clean_video_df (selain kolom opsional seperti sourceHashtag)
+CLEAN_COLUMNS = COLUMNS_NEEDED + ['hashtags', 'emoji', 'text_clean', 'language']
+
+_stem_cache = None
+
+@lru_cache(maxsize=None)
+def _stem_namespace(language):
+    # namespace cache stem per bahasa (ikut versi library stemmer)
+    if language == 'id':
+        return stemmer_namespace('id', 'Sastrawi')
+    # hasil Porter saja beda dengan Porter + WordNet, jangan campur di cache
+    if resources.get("wordnet_lemmatizer") is None:
+        return stemmer_namespace('en-porter', 'nltk')
+    return stemmer_namespace('en', 'nltk')
+
+def get_stem_cache():
+    """Cache stem persistent, dibuat saat pertama kali dipakai."""
+    global _stem_cache
+    if _stem_cache is None:
+        _stem_cache = StemCache()
+    return _stem_cache
+
+def _stem_id(word):
+    return resources.get("sastrawi_stemmer").stem(word)
+
+def _stem_en(word):
+    stem = resources.get("porter_stemmer").stem(word)
+    lemmatizer = resources.get("wordnet_lemmatizer")
+    return stem if lemmatizer is None else lemmatizer.lemmatize(stem)
+
+def stem_tokens(tokens, language='id'):
+    """Stem token (unik sekali saja) lewat cache persistent. Returns dict token -> stem."""
+    if language.lower() == 'id':
+        return get_stem_cache().stem_many(tokens, _stem_namespace('id'), _stem_id)
+    return get_stem_cache().stem_many(tokens, _stem_namespace('en'), _stem_en)
+
 def clean_caption(text, language='id'):
     if pd.isna(text):
         return ""
@@ -39,7 +100,7 @@ def clean_caption(text, language='id'):
     text = re.sub(r"#\w+", " ", text)
     
     # hilangkan emoji
-    text = emoji.replace_emoji(text, replace=' ')
+    text = get_emoji_matcher().split(text)[0]
     
     # hilangkan URL
     text = re.sub(r"http\S+|www.\S+", " ", text)
@@ -51,50 +112,277 @@ def clean_caption(text, language='id'):
     text = re.sub(r"\s+", " ", text).strip()
     
     # pilih stopwords sesuai bahasa
-    if language.lower() == 'id':
-        STOPWORDS_LIB = set(stopwords.words('indonesian'))
-        STOPWORDS = STOPWORDS_LIB.union(CUSTOM_STOPWORDS_ID)
-    else:
-        STOPWORDS_LIB = set(stopwords.words('english'))
-        STOPWORDS = STOPWORDS_LIB.union(CUSTOM_STOPWORDS_EN)
+    STOPWORDS = get_stopwords(language)
     
     # tokenization & remove stopwords
     tokens = [w for w in text.split() if w not in STOPWORDS]
     
-    # stemming + lemmatization
-    if language.lower() == 'id':
-        tokens = [sastrawi_stemmer.stem(w) for w in tokens]
-        # untuk bahasa Indonesia, lemmatization bisa di-skip karena stemming sudah cukup
-    else:
-        tokens = [porter.stem(w) for w in tokens]
-        tokens = [lemmatizer.lemmatize(w) for w in tokens]
+    # stemming + lemmatization (lewat cache stem)
+    # untuk bahasa Indonesia, lemmatization bisa di-skip karena stemming sudah cukup
+    stems = stem_tokens(tokens, language)
+    tokens = [stems[w] for w in tokens]
     
     return " ".join(tokens)
 
-def clean_video_df(df_raw):
-    """Membersihkan DataFrame hasil scraping video TikTok."""
+# regex precompiled untuk clean_caption_column
+_HASHTAG_RE = re.compile(r"#\w+")
+_URL_RE = re.compile(r"http\S+|www.\S+")
+_WORD_RE = re.compile(r"[a-z]+")
+# fused single pass: hashtag dibuang (group kosong), kata [a-z]+ diambil
+_HASHTAG_OR_WORD_RE = re.compile(r"#\w+|([a-z]+)")
+
+@lru_cache(maxsize=None)
+def get_stopwords(language='id'):
+    """Stopwords library + custom sesuai bahasa (sama seperti di clean_caption), dibangun sekali per proses."""
+    stopwords = resources.get("stopwords")
+    if language.lower() == 'id':
+        return frozenset(stopwords.words('indonesian')).union(CUSTOM_STOPWORDS_ID)
+    return frozenset(stopwords.words('english')).union(CUSTOM_STOPWORDS_EN)
+
+def _caption_tokens(text, stripped=None):
+    # setelah lower(), token akhir clean_caption = run huruf [a-z] di luar hashtag/URL;
+    # `stripped` = caption yang emojinya sudah dibuang EmojiMatcher (kalau sudah di-scan)
+    lower = text.lower()
+
+    if "http" in lower or "www" in lower:
+        # jalur persis: emoji yang dihapus bisa memotong URL, jadi emoji dibuang sebelum URL
+        if stripped is None:
+            stripped = get_emoji_matcher().split(text)[0]
+        text = _HASHTAG_RE.sub(" ", stripped.lower())
+        text = _URL_RE.sub(" ", text)
+        return _WORD_RE.findall(text)
+
+    text = lower
+
+    # tanpa URL, emoji cukup dibuang bersama karakter non-huruf lain
+    return [w for w in _HASHTAG_OR_WORD_RE.findall(text) if w]
+
+def clean_caption_column(texts, language='id', return_language=False):
+    """
+    Versi vectorized dari `texts.apply(clean_caption)` dengan output identik.
+    Caption unik dibersihkan sekali, stopwords dibangun sekali, dan setiap
+    token unik di-stem sekali.
+    `language='auto'` mendeteksi bahasa per caption lalu membersihkan setiap
+    kelompok bahasa dengan stopwords & stemmer-nya sendiri.
+    """
+    texts = pd.Series(texts)
+    codes, uniques = pd.factorize(texts)
+    return _clean_factorized(codes, uniques, texts.index, language, return_language)
+
+def _clean_factorized(codes, uniques, index, language='id', return_language=False, stripped=None):
+    # isi clean_caption_column untuk caption yang sudah di-factorize
+    if stripped is None:
+        stripped = [None] * len(uniques)
+    raw_tokens = [_caption_tokens(t, s) for t, s in zip(uniques, stripped)]
+    if language == 'auto':
+        # deteksi pakai token sebelum stopword dibuang (stopword = sinyal terkuat)
+        languages = detect_languages(raw_tokens)
+    else:
+        languages = [language] * len(raw_tokens)
+
+    groups = {}
+    for i, lang in enumerate(languages):
+        groups.setdefault(lang, []).append(i)
+
+    # index -1 (NaN) -> "" di posisi terakhir
+    cleaned = np.empty(len(uniques) + 1, dtype=object)
+    cleaned[-1] = ""
+
+    for lang, idx in groups.items():
+        stop = get_stopwords(lang)
+        token_lists = [[w for w in raw_tokens[i] if w not in stop] for i in idx]
+
+        vocab = set()
+        for tokens in token_lists:
+            vocab.update(tokens)
+        stems = stem_tokens(vocab, lang)
+
+        cleaned[idx] = [" ".join([stems[w] for w in tokens]) for tokens in token_lists]
+
+    cleaned = pd.Series(cleaned[codes], index=index, dtype=object)
+    if not return_language:
+        return cleaned
+
+    fallback = DEFAULT_LANGUAGE if language == 'auto' else language
+    languages = np.array(languages + [fallback], dtype=object)
+    return cleaned, pd.Series(languages[codes], index=index, dtype=object)
+
+# minimal jumlah baris sebelum clean_video_df memakai process pool
+PARALLEL_MIN_ROWS = 20_000
+
+def _text_features(texts, language='auto'):
+    """
+    Kolom turunan caption. Setiap caption unik di-scan EmojiMatcher sekali:
+    teks tanpa emoji dipakai clean_caption, sequence-nya jadi kolom emoji.
+    Returns (DataFrame fitur, Counter frekuensi emoji seluruh baris).
+    """
+    codes, uniques = pd.factorize(texts)
+
+    matcher = get_emoji_matcher()
+    split = [matcher.split(t) if isinstance(t, str) else (t, []) for t in uniques]
+    text_clean, languages = _clean_factorized(codes, uniques, texts.index, language, return_language=True,
+                                              stripped=[stripped for stripped, _ in split])
+
+    # index -1 (NaN) -> list kosong di posisi terakhir
+    found = [emojis for _, emojis in split] + [[]]
+    emoji_counts = Counter()
+    for emojis, n in zip(found, np.bincount(codes[codes >= 0], minlength=len(uniques)).tolist()):
+        for seq in emojis:
+            emoji_counts[seq] += n
+
+    features = pd.DataFrame({
+        "hashtags": texts.apply(extract_hashtags),
+        "emoji": pd.Series([list(found[c]) for c in codes], index=texts.index, dtype=object),
+        "text_clean": text_clean,
+        "language": languages,
+    }, index=texts.index)
+    return features, emoji_counts
+
+def _init_clean_worker(stem_db_path=None):
+    # stopwords, stemmer & cache stem disiapkan sekali per worker, bukan per shard;
+    # worker tidak menulis sqlite sendiri, stem baru dikirim balik ke proses induk
+    global _stem_cache
+    _stem_cache = StemCache(stem_db_path or DEFAULT_STEM_DB, write_back=False)
+    get_stopwords('id')
+    get_stopwords('en')
+    resources.get("sastrawi_stemmer")
+    get_language_model()
+    get_emoji_matcher()
+
+def _text_features_worker(texts, language='auto'):
+    features, emoji_counts = _text_features(texts, language)
+    return features, emoji_counts, get_stem_cache().take_unsaved()
+
+def _text_features_parallel(texts, n_jobs, language='auto'):
+    n_shards = min(n_jobs, len(texts))
+    bounds = np.linspace(0, len(texts), n_shards + 1, dtype=int)
+    shards = [texts.iloc[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+
+    # spawn, bukan fork: fork dari server Streamlit yang multithread bisa deadlock
+    context = mp.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=n_shards, mp_context=context,
+                             initializer=_init_clean_worker,
+                             initargs=(get_stem_cache().db_path,)) as pool:
+        # map menjaga urutan shard
+        results = list(pool.map(_text_features_worker, shards, [language] * n_shards))
+
+    # stem baru dari semua worker ditulis sekali oleh proses ini
+    cache = get_stem_cache()
+    emoji_counts = Counter()
+    for _, counts, stems in results:
+        cache.store_many(stems)
+        emoji_counts.update(counts)
+
+    return pd.concat([features for features, _, _ in results]), emoji_counts
+
+def clean_video_df(df_raw, parallel=None, n_jobs=None, language='auto',
+                   near_duplicates=None, near_duplicate_threshold=0.8, return_emoji_counts=False):
+    """
+    Membersihkan DataFrame hasil scraping video TikTok.
+    `parallel=None` memilih otomatis: process pool jika baris >= PARALLEL_MIN_ROWS.
+    `language='auto'` mendeteksi bahasa tiap caption (kolom `language`);
+    isi 'id' / 'en' untuk memaksa satu bahasa. Data NLTK: 'stopwords' wajib,
+    'wordnet' opsional (tanpa wordnet caption Inggris hanya di-stem Porter).
+    `near_duplicates='mark'` menandai caption yang hampir sama (MinHash/LSH),
+    `'collapse'` hanya menyisakan video pertama tiap kelompok.
+    `return_emoji_counts=True` -> returns (df, Counter emoji) supaya frekuensi
+    emoji tidak perlu dihitung ulang (mis. oleh wordclouds.term_frequencies).
+    """
+
+    if df_raw.empty:
+        return (empty_clean_df(), Counter()) if return_emoji_counts else empty_clean_df()
 
     df = df_raw.copy()
-    columns_needed = [
-        'authorMeta.name',
-        'text',
-        'diggCount',
-        'shareCount',
-        'playCount',
-        'commentCount',
-        'collectCount',
-        'videoMeta.duration',
-        'createTimeISO',
-        'webVideoUrl'
-    ]
-    df = df[columns_needed]
-
-    # drop duplikat
-    df = df.drop_duplicates().reset_index(drop=True)
+    # kolom opsional (mis. hasil scrape_videos_batch)
+    columns_optional = ['sourceHashtag']
+    df = df[COLUMNS_NEEDED + [c for c in columns_optional if c in df.columns]]
+
+    # drop duplikat: satu baris per video, hashtag sumber digabung jadi list
+    df = df.drop_duplicates()
+    df = _dedup_videos(df)
 
     df['createTimeISO'] = pd.to_datetime(df['createTimeISO'])
-    df["hashtags"] = df["text"].apply(extract_hashtags)
-    df["emoji"] = df["text"].apply(extract_emoji)
-    df["text_clean"] = df["text"].apply(clean_caption)
 
-    return df
\ No newline at end of file
+    n_jobs = n_jobs or os.cpu_count() or 1
+    if parallel is None:
+        parallel = n_jobs > 1 and len(df) >= PARALLEL_MIN_ROWS
+
+    if parallel and n_jobs > 1 and len(df) > 1:
+        features, emoji_counts = _text_features_parallel(df["text"], n_jobs, language)
+    else:
+        features, emoji_counts = _text_features(df["text"], language)
+
+    df["hashtags"] = features["hashtags"]
+    df["emoji"] = features["emoji"]
+    df["text_clean"] = features["text_clean"]
+    df["language"] = features["language"]
+
+    df = apply_near_duplicates(df, near_duplicates, near_duplicate_threshold)
+    if not return_emoji_counts:
+        return df
+    if near_duplicates == 'collapse':
+        # sebagian video dibuang -> hitung dari baris yang tersisa
+        emoji_counts = emoji_column_counts(df["emoji"])
+    return df, emoji_counts
+
+def emoji_column_counts(emoji_lists):
+    """Counter emoji dari kolom list emoji."""
+    return Counter(seq for emojis in emoji_lists for seq in emojis)
+
+def empty_clean_df():
+    """DataFrame kosong dengan schema hasil clean_video_df (mis. scraping tanpa hasil)."""
+    df = pd.DataFrame({col: pd.Series(dtype=object) for col in CLEAN_COLUMNS})
+    df['createTimeISO'] = pd.to_datetime(df['createTimeISO'], utc=True)
+    return df
+
+def apply_near_duplicates(df, mode=None, threshold=0.8):
+    """mode None -> tidak diubah, 'mark' -> tambah kolom penanda, 'collapse' -> buang near-duplicate."""
+    if mode is None or df.empty:
+        return df
+    if mode == 'mark':
+        return mark_near_duplicates(df, threshold=threshold)
+    if mode == 'collapse':
+        return collapse_near_duplicates(df, threshold=threshold)
+    raise ValueError(f"near_duplicates harus None, 'mark' atau 'collapse', bukan {mode!r}")
+
+def clean_video_pages(pages):
+    """Membersihkan page-page hasil scraping satu per satu (streaming)."""
+    for df_page in pages:
+        if df_page.empty:
+            continue
+        yield clean_video_df(df_page)
+
+def _unique_sources(values):
+    # hashtag sumber (string mentah atau list hasil dedup sebelumnya) tanpa duplikat, urutan dijaga
+    tags = []
+    for value in values:
+        for tag in (value if isinstance(value, (list, tuple, np.ndarray)) else [value]):
+            if isinstance(tag, str) and tag not in tags:
+                tags.append(tag)
+    return tags
+
+def _dedup_videos(df):
+    """
+    Satu baris per webVideoUrl (baris pertama dipakai). Video yang muncul di
+    beberapa hashtag tidak diulang; kolom sourceHashtag jadi list hashtag sumbernya.
+    Baris tanpa URL tidak dianggap duplikat satu sama lain.
+    """
+    df = df.reset_index(drop=True)
+    key = df['webVideoUrl'].astype(object)
+    missing = key.isna()
+    key[missing] = -np.arange(1, missing.sum() + 1)
+    first = ~key.duplicated().to_numpy()
+
+    if 'sourceHashtag' in df.columns:
+        sources = df['sourceHashtag'].groupby(key, sort=False).agg(_unique_sources)
+        df = df[first].reset_index(drop=True)
+        df['sourceHashtag'] = key[first].map(sources).to_numpy()
+        return df
+    return df[first].reset_index(drop=True)
+
+def merge_clean_pages(parts):
+    """Gabungkan page yang sudah dibersihkan dan buang video duplikat antar page."""
+    parts = [df for df in parts if not df.empty]
+    if not parts:
+        return empty_clean_df()
+    return _dedup_videos(pd.concat(parts, ignore_index=True))
@@ -1,82 +1,176 @@
-# import requests
-# import pandas as pd
-# import math
-
-
-# def _fetch_comments_from_apify(token, video_url, max_items):
-#     """
-#     Fetch raw comments from Apify TikTok Comments Scraper.
-#     Only retrieves main comments.
-#     """
-
-#     url = f"https://api.apify.com/v2/acts/clockworks~tiktok-comments-scraper/run-sync-get-dataset-items?token={token}"
-
-#     payload = {
-#         "videoUrl": video_url,     
-#         "maxComments": max_items, 
-#         "depth": 1                
-#     }
-
-#     res = requests.post(url, json=payload, timeout=120)
-#     res.raise_for_status()
-
-#     data = res.json()
-#     df = pd.json_normalize(data)
-
-#     if "parentCommentId" in df.columns:
-#         df = df[df["parentCommentId"].isna()].reset_index(drop=True)
-
-#     return df
-
-# def _sample_size(total_comments, threshold_comment, small_video_percent, big_video_percent):
-#     if total_comments < threshold_comment:
-#         ratio = small_video_percent
-#     else:
-#         ratio = big_video_percent
-
-#     return max(1, math.ceil(total_comments * ratio))
-
-
-# def scrape_comments(df_videos,
-#                     token,
-#                     threshold_comment=50,
-#                     small_video_percent=0.20,
-#                     big_video_percent=0.10):
-
-#     all_results = []
-
-#     for _, row in df_videos.iterrows():
-#         video_url = row.get("webVideoUrl")
-#         total_comments = int(row.get("commentCount", 0))
-
-#         if not video_url or total_comments == 0:
-#             continue
-
-#         sample_n = _sample_size(total_comments, threshold_comment,
-#                                 small_video_percent, big_video_percent)
-
-#         try:
-#             df_comments = _fetch_comments_from_apify(
-#                 token=token,
-#                 video_url=video_url,
-#                 max_items=sample_n * 5
-#             )
-
-#             if df_comments.empty:
-#                 continue
-
-#             if len(df_comments) > sample_n:
-#                 df_comments = df_comments.sample(n=sample_n, random_state=42)
-
-#             df_comments["videoUrl"] = video_url
-#             df_comments["videoAuthor"] = row.get("authorMeta.name", "")
-
-#             all_results.append(df_comments)
-
-#         except Exception as e:
-#             print(f"[ERROR] Gagal scrape komentar untuk {video_url}: {e}")
-
-#     if not all_results:
-#         return pd.DataFrame()
-
-#     return pd.concat(all_results, ignore_index=True)
\ No newline at end of file
+import math
+import time
+import random
+import threading
+import requests
+import pandas as pd
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from src.scraping.video_scraping import make_session, APIFY_BASE_URL
+
+COMMENT_ACTOR = "clockworks~tiktok-comments-scraper"
+
+# status HTTP yang layak dicoba ulang
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+class TokenBucket:
+    """Rate limiter token bucket: maksimal `rate` request per detik dengan burst `capacity`."""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1, rate)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+def _fetch_comments_from_apify(token, video_url, max_items, session=None, base_url=APIFY_BASE_URL):
+    """
+    Fetch raw comments from Apify TikTok Comments Scraper.
+    Only retrieves main comments.
+    """
+
+    url = f"{base_url}/acts/{COMMENT_ACTOR}/run-sync-get-dataset-items?token={token}"
+
+    payload = {
+        "videoUrl": video_url,
+        "maxComments": max_items,
+        "depth": 1
+    }
+
+    http = session if session is not None else requests
+    res = http.post(url, json=payload, timeout=120)
+    res.raise_for_status()
+
+    data = res.json()
+    df = pd.json_normalize(data)
+
+    if "parentCommentId" in df.columns:
+        df = df[df["parentCommentId"].isna()].reset_index(drop=True)
+
+    return df
+
+def _fetch_with_retry(fetch, rate_limiter, max_retries, backoff_base):
+    """Panggil `fetch` dengan rate limit dan retry exponential backoff (+ jitter)."""
+    for attempt in range(max_retries + 1):
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        try:
+            return fetch()
+        except requests.HTTPError as e:
+            status = e.response.status_code if e.response is not None else None
+            if status not in RETRY_STATUS or attempt == max_retries:
+                raise
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == max_retries:
+                raise
+
+        time.sleep(backoff_base * (2 ** attempt) + random.uniform(0, backoff_base))
+
+def _sample_size(total_comments, threshold_comment, small_video_percent, big_video_percent):
+    if total_comments < threshold_comment:
+        ratio = small_video_percent
+    else:
+        ratio = big_video_percent
+
+    return max(1, math.ceil(total_comments * ratio))
+
+def iter_comments(df_videos,
+                  token,
+                  threshold_comment=50,
+                  small_video_percent=0.20,
+                  big_video_percent=0.10,
+                  max_workers=5,
+                  requests_per_second=2,
+                  max_retries=3,
+                  backoff_base=1.0,
+                  base_url=APIFY_BASE_URL):
+    """
+    Scrape komentar banyak video secara paralel (dibatasi `max_workers` dan
+    rate limiter). Yield DataFrame komentar setiap kali satu video selesai.
+    """
+    jobs = []
+    for row in df_videos.to_dict("records"):
+        video_url = row.get("webVideoUrl")
+        total_comments = row.get("commentCount", 0)
+        total_comments = 0 if pd.isna(total_comments) else int(total_comments)
+
+        if not video_url or total_comments == 0:
+            continue
+
+        sample_n = _sample_size(total_comments, threshold_comment,
+                                small_video_percent, big_video_percent)
+        jobs.append((video_url, row.get("authorMeta.name", ""), sample_n))
+
+    if not jobs:
+        return
+
+    rate_limiter = TokenBucket(requests_per_second) if requests_per_second else None
+    n_workers = max(1, min(max_workers, len(jobs)))
+
+    with make_session(pool_size=n_workers) as session:
+        def _scrape_one(video_url, video_author, sample_n):
+            df_comments = _fetch_with_retry(
+                lambda: _fetch_comments_from_apify(
+                    token=token,
+                    video_url=video_url,
+                    max_items=sample_n * 5,
+                    session=session,
+                    base_url=base_url
+                ),
+                rate_limiter, max_retries, backoff_base
+            )
+
+            if df_comments.empty:
+                return df_comments
+
+            if len(df_comments) > sample_n:
+                df_comments = df_comments.sample(n=sample_n, random_state=42)
+
+            df_comments["videoUrl"] = video_url
+            df_comments["videoAuthor"] = video_author
+            return df_comments
+
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            futures = {pool.submit(_scrape_one, *job): job[0] for job in jobs}
+
+            try:
+                for future in as_completed(futures):
+                    try:
+                        df_comments = future.result()
+                    except Exception as e:
+                        print(f"[ERROR] Gagal scrape komentar untuk {futures[future]}: {e}")
+                        continue
+
+                    if not df_comments.empty:
+                        yield df_comments
+            finally:
+                # consumer berhenti lebih awal -> batalkan video yang belum jalan
+                for future in futures:
+                    future.cancel()
+
+def scrape_comments(df_videos,
+                    token,
+                    threshold_comment=50,
+                    small_video_percent=0.20,
+                    big_video_percent=0.10,
+                    **kwargs):
+
+    all_results = list(iter_comments(df_videos, token, threshold_comment,
+                                     small_video_percent, big_video_percent, **kwargs))
+
+    if not all_results:
+        return pd.DataFrame()
+
+    return pd.concat(all_results, ignore_index=True)
@@ -0,0 +1,128 @@
+import os
+import re
+import json
+import hashlib
+import threading
+import pandas as pd
+
+from src.scraping.video_scraping import scrape_videos, APIFY_BASE_URL
+from src.cleaning.video_cleaning import clean_video_df, COLUMNS_NEEDED
+from src.cleaning.schema import LIST_COLUMNS
+
+DEFAULT_STORE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "tiktok_analytics", "store")
+
+# kolom counter yang di-update untuk video yang sudah pernah di-scrape
+UPSERT_COUNTERS = ['diggCount', 'shareCount', 'playCount', 'commentCount', 'collectCount']
+
+class VideoStore:
+    """
+    Dataset video bersih yang dipersist per hashtag (parquet) beserta
+    watermark createTimeISO terbaru untuk scraping incremental.
+    Parquet per hashtag dibaca sekali lalu disimpan di memori sampai merge berikutnya.
+    """
+
+    def __init__(self, store_dir=DEFAULT_STORE_DIR):
+        self.store_dir = store_dir
+        # RLock: merge() memanggil load() sambil memegang lock
+        self._lock = threading.RLock()
+        self._watermark_path = os.path.join(store_dir, "watermarks.json")
+        self._frames = {}
+
+        os.makedirs(store_dir, exist_ok=True)
+        try:
+            with open(self._watermark_path, "r", encoding="utf-8") as f:
+                self._watermarks = json.load(f)
+        except (OSError, ValueError):
+            self._watermarks = {}
+
+    def _path(self, hashtag):
+        safe = re.sub(r"\W+", "_", hashtag.lower()).strip("_")
+        digest = hashlib.sha1(hashtag.encode("utf-8")).hexdigest()[:8]
+        return os.path.join(self.store_dir, f"{safe}_{digest}.parquet")
+
+    def _read(self, hashtag):
+        path = self._path(hashtag)
+        if not os.path.exists(path):
+            return pd.DataFrame()
+
+        df = pd.read_parquet(path)
+        # parquet mengembalikan numpy array, kembalikan ke list seperti clean_video_df
+        for col in LIST_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].map(list)
+        return df
+
+    def load(self, hashtag):
+        """Dataset hashtag dari memori; parquet hanya dibaca pada akses pertama."""
+        with self._lock:
+            if hashtag not in self._frames:
+                self._frames[hashtag] = self._read(hashtag)
+            return self._frames[hashtag]
+
+    def watermark(self, hashtag):
+        value = self._watermarks.get(hashtag)
+        return pd.Timestamp(value) if value else None
+
+    def known_urls(self, hashtag):
+        df = self.load(hashtag)
+        if df.empty:
+            return set()
+        return set(df['webVideoUrl'])
+
+    def merge(self, hashtag, df_new, df_seen):
+        """
+        Append video baru (sudah bersih) dan upsert counter video yang sudah ada.
+        Returns (jumlah video baru, jumlah video yang di-update).
+        """
+        with self._lock:
+            df_store = self.load(hashtag)
+
+            n_updated = 0
+            if not df_store.empty and not df_seen.empty:
+                seen = df_seen.drop_duplicates(subset='webVideoUrl', keep='last').set_index('webVideoUrl')
+                store_idx = df_store.set_index('webVideoUrl')
+                store_idx.update(seen[UPSERT_COUNTERS])
+                n_updated = int(store_idx.index.isin(seen.index).sum())
+                df_store = store_idx.reset_index()[df_store.columns]
+
+            df_store = pd.concat([df_store, df_new], ignore_index=True) if not df_store.empty else df_new
+            if df_store.empty:
+                return 0, n_updated
+
+            df_store = df_store.drop_duplicates(subset='webVideoUrl', keep='first').reset_index(drop=True)
+            df_store.to_parquet(self._path(hashtag), compression="zstd", index=False)
+            self._frames[hashtag] = df_store
+
+            self._watermarks[hashtag] = df_store['createTimeISO'].max().isoformat()
+            tmp_path = self._watermark_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._watermarks, f)
+            os.replace(tmp_path, self._watermark_path)
+
+            return len(df_new), n_updated
+
+def scrape_incremental(token, hashtag, store, limit=50, session=None, base_url=APIFY_BASE_URL):
+    """
+    Scrape hanya video yang belum ada di store sejak watermark terakhir,
+    lalu gabungkan ke dataset yang dipersist.
+    Returns (DataFrame lengkap hashtag tsb, dict statistik).
+    """
+    since = store.watermark(hashtag)
+    options = {"oldestPostDateUnified": since.strftime("%Y-%m-%d")} if since is not None else None
+
+    df_raw = scrape_videos(token, hashtag, limit, session=session, base_url=base_url,
+                           columns=COLUMNS_NEEDED, options=options)
+
+    if df_raw.empty:
+        return store.load(hashtag), {"new": 0, "updated": 0}
+
+    is_known = df_raw['webVideoUrl'].isin(store.known_urls(hashtag))
+
+    # hanya video baru yang perlu dibersihkan (clean_caption mahal)
+    df_new = df_raw[~is_known]
+    df_new = clean_video_df(df_new) if not df_new.empty else df_new
+    df_seen = df_raw[is_known]
+
+    n_new, n_updated = store.merge(hashtag, df_new, df_seen)
+
+    return store.load(hashtag), {"new": n_new, "updated": n_updated}
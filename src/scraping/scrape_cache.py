@@ -0,0 +1,149 @@
+import os
+import json
+import time
+import hashlib
+import threading
+import pandas as pd
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "tiktok_analytics", "scrape")
+
+class ScrapeCache:
+    """
+    Cache hasil scraping di disk (parquet terkompresi) dengan TTL dan
+    eviction LRU berdasarkan total ukuran file. Hasil kosong tidak di-cache;
+    index.json hanya ditulis saat put/eviction, bukan di setiap hit.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, ttl=3600, max_bytes=500 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._index_path = os.path.join(cache_dir, "index.json")
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self._index = self._load_index()
+
+    @staticmethod
+    def make_key(actor, hashtag, limit, options=None):
+        raw = json.dumps([actor, hashtag, limit, options or {}], sort_keys=True, default=str)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def _load_index(self):
+        try:
+            with open(self._index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self):
+        tmp_path = self._index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, self._index_path)
+
+    def _remove(self, key):
+        entry = self._index.pop(key, None)
+        if entry:
+            try:
+                os.remove(os.path.join(self.cache_dir, entry["file"]))
+            except OSError:
+                pass
+
+    def _evict(self):
+        # buang entry yang expired, lalu yang paling lama tidak diakses sampai muat
+        now = time.time()
+        for key in [k for k, e in self._index.items() if now - e["created"] > self.ttl]:
+            self._remove(key)
+
+        total = sum(e["size"] for e in self._index.values())
+        for key in sorted(self._index, key=lambda k: self._index[k]["last_access"]):
+            if total <= self.max_bytes:
+                break
+            total -= self._index[key]["size"]
+            self._remove(key)
+
+    def get(self, key):
+        # lock hanya untuk lookup index; parquet dibaca di luar lock
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None or time.time() - entry["created"] > self.ttl:
+                if entry is not None:
+                    self._remove(key)
+                    self._save_index()
+                self.misses += 1
+                return None
+            file_name = entry["file"]
+
+        path = os.path.join(self.cache_dir, file_name)
+        try:
+            if file_name.endswith(".parquet"):
+                df = pd.read_parquet(path)
+            else:
+                df = pd.read_pickle(path)
+        except (OSError, ValueError):
+            with self._lock:
+                # entry bisa sudah diganti put() lain selama file dibaca
+                if self._index.get(key, {}).get("file") == file_name:
+                    self._remove(key)
+                    self._save_index()
+                self.misses += 1
+            return None
+
+        with self._lock:
+            # last_access cukup di memori; index.json ditulis saat put/eviction
+            if key in self._index:
+                self._index[key]["last_access"] = time.time()
+            self.hits += 1
+        return df
+
+    def put(self, key, df):
+        # hasil kosong (hashtag salah ketik, run gagal) tidak di-cache
+        if df.empty:
+            return
+
+        # tulis ke file sementara di luar lock lalu os.replace supaya get() tidak membaca file setengah jadi
+        # parquet (columnar + zstd); kolom nested yang tidak didukung arrow -> pickle gzip
+        file_name = f"{key}.parquet"
+        tmp_path = os.path.join(self.cache_dir, f"{file_name}.{threading.get_ident()}.tmp")
+        try:
+            df.to_parquet(tmp_path, compression="zstd", index=False)
+        except (ImportError, ValueError, TypeError, NotImplementedError):
+            file_name = f"{key}.pkl.gz"
+            df.to_pickle(tmp_path, compression="gzip")
+        path = os.path.join(self.cache_dir, file_name)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            old = self._index.get(key)
+            if old is not None and old["file"] != file_name:
+                self._remove(key)
+
+            now = time.time()
+            self._index[key] = {
+                "file": file_name,
+                "created": now,
+                "last_access": now,
+                "size": os.path.getsize(path),
+            }
+            self._evict()
+            self._save_index()
+
+    def clear(self):
+        with self._lock:
+            for key in list(self._index):
+                self._remove(key)
+            self._save_index()
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "entries": len(self._index),
+                "bytes": sum(e["size"] for e in self._index.values()),
+            }
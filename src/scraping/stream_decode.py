@@ -0,0 +1,101 @@
+import re
+import json
+import codecs
+import pandas as pd
+
+_WHITESPACE = re.compile(r"\s*")
+
+def iter_json_array(chunks):
+    """
+    Decode array JSON secara incremental dari potongan bytes (mis. res.iter_content).
+    Yield satu item setiap kali item tersebut sudah lengkap di buffer (sudah diikuti
+    ',' atau ']'). ValueError kalau bukan array, item tidak dipisah koma, atau
+    stream berakhir sebelum ']'.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buf = ""
+    pos = 0
+    # start -> first (item / ']') -> sep (',' / ']') -> item -> sep ...
+    state = "start"
+    closed = False
+
+    for chunk in chunks:
+        buf = buf[pos:] + text_decoder.decode(chunk)
+        pos = 0
+
+        while not closed:
+            pos = _WHITESPACE.match(buf, pos).end()
+            if pos >= len(buf):
+                break
+            char = buf[pos]
+
+            if state == "start":
+                if char != "[":
+                    raise ValueError("Response bukan JSON array")
+                state = "first"
+                pos += 1
+                continue
+
+            if state == "sep":
+                if char not in ",]":
+                    raise ValueError("JSON array tidak valid: item harus dipisah ','")
+                closed = char == "]"
+                state = "item"
+                pos += 1
+                continue
+
+            if char == "]":
+                if state != "first":
+                    raise ValueError("JSON array tidak valid: ',' sebelum ']'")
+                closed = True
+                pos += 1
+                continue
+
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                # item belum lengkap, tunggu chunk berikutnya
+                break
+
+            # item di ujung buffer (mis. angka 12 dari 1234) belum tentu lengkap
+            after = _WHITESPACE.match(buf, end).end()
+            if after >= len(buf):
+                break
+
+            yield item
+            pos = end
+            state = "sep"
+
+        if closed:
+            return
+
+    raise ValueError("JSON array terpotong / tidak lengkap")
+
+def _get_path(item, path):
+    # key datar dulu (mis. hasil yang sudah di-normalize), lalu nested "a.b.c"
+    if path in item:
+        return item[path]
+
+    value = item
+    for key in path.split("."):
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+def project_items(items, columns):
+    """
+    Ambil hanya path yang dibutuhkan dari setiap item langsung ke array per kolom.
+    Returns a DataFrame dengan kolom sesuai urutan `columns`.
+    """
+    data = {col: [] for col in columns}
+    for item in items:
+        for col in columns:
+            data[col].append(_get_path(item, col))
+
+    return pd.DataFrame({col: pd.Series(values) for col, values in data.items()})
+
+def decode_projected(chunks, columns):
+    """Streaming decode + projection: memori sebanding kolom yang diambil, bukan seluruh payload."""
+    return project_items(iter_json_array(chunks), columns)
@@ -1,14 +1,23 @@
+import time
 import requests
 import pandas as pd
 
-def scrape_videos(token, hashtag, limit=50):
-    """
-    Scrape TikTok metadata via Apify synchronous run.
-    Returns a DataFrame.
-    """
-    URL = f"https://api.apify.com/v2/acts/clockworks~tiktok-scraper/run-sync-get-dataset-items?token={token}"
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from src.scraping.stream_decode import decode_projected, project_items
+
+APIFY_BASE_URL = "https://api.apify.com/v2"
+VIDEO_ACTOR = "clockworks~tiktok-scraper"
+
+# status run Apify yang sudah final
+TERMINAL_STATUSES = {"SUCCEEDED", "FAILED", "TIMED-OUT", "ABORTED"}
 
-    hashtags = []
+# timeout (connect, read) dalam detik untuk request status/dataset yang pendek
+REQUEST_TIMEOUT = (10, 60)
+# run-sync menunggu actor selesai di sisi Apify (maks. 300 detik)
+SYNC_TIMEOUT = (10, 320)
+
+def _video_payload(hashtag, limit, options=None):
     payload = {
         "hashtags": [hashtag],
         #"maxItems": limit,
@@ -17,11 +26,167 @@ def scrape_videos(token, hashtag, limit=50):
         "shouldDownloadCovers": False,
         "shouldDownloadComments": False
     }
+    # input actor tambahan (mis. oldestPostDateUnified)
+    payload.update(options or {})
+    return payload
+
+def make_session(pool_size=10):
+    """
+    Buat requests.Session dengan connection pool yang bisa dipakai ulang
+    oleh beberapa thread sekaligus.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
-    res = requests.post(URL, json=payload)
+def scrape_videos(token, hashtag, limit=50, session=None, base_url=APIFY_BASE_URL, columns=None,
+                  cache=None, options=None):
+    """
+    Scrape TikTok metadata via Apify synchronous run.
+    Jika `columns` diisi, response di-decode secara streaming dan hanya path
+    tersebut yang diambil (mis. 'authorMeta.name').
+    Jika `cache` (ScrapeCache) diisi, hasil yang masih valid diambil dari disk.
+    `options` ditambahkan ke input actor.
+    Returns a DataFrame.
+    """
+    if cache is not None:
+        key = cache.make_key(VIDEO_ACTOR, hashtag, limit, {"columns": columns, "options": options})
+        df = cache.get(key)
+        if df is None:
+            df = scrape_videos(token, hashtag, limit, session=session, base_url=base_url, columns=columns,
+                               options=options)
+            cache.put(key, df)
+        return df
+
+    URL = f"{base_url}/acts/{VIDEO_ACTOR}/run-sync-get-dataset-items?token={token}"
+
+    payload = _video_payload(hashtag, limit, options)
+
+    http = session if session is not None else requests
+
+    if columns is not None:
+        with http.post(URL, json=payload, stream=True, timeout=SYNC_TIMEOUT) as res:
+            res.raise_for_status()
+            return decode_projected(res.iter_content(chunk_size=65536), columns)
+
+    res = http.post(URL, json=payload, timeout=SYNC_TIMEOUT)
     res.raise_for_status()
 
     data = res.json()
     df = pd.json_normalize(data)
 
-    return df
\ No newline at end of file
+    return df
+
+def _abort_run(http, base_url, token, run_id):
+    """Hentikan run Apify yang masih berjalan (best effort)."""
+    try:
+        http.post(f"{base_url}/actor-runs/{run_id}/abort?token={token}", timeout=REQUEST_TIMEOUT)
+    except requests.RequestException:
+        pass
+
+def iter_video_pages(token, hashtag, limit=50, page_size=100, poll_interval=5,
+                     session=None, base_url=APIFY_BASE_URL, columns=None, options=None,
+                     max_wait=600):
+    """
+    Jalankan actor Apify secara asynchronous lalu ambil dataset per page
+    selama run masih berjalan. Yield DataFrame untuk setiap page.
+    `options` ditambahkan ke input actor. Jika run belum selesai setelah
+    `max_wait` detik, run di-abort dan TimeoutError dilempar.
+    """
+    http = session if session is not None else requests
+
+    # start run (tidak menunggu selesai)
+    res = http.post(f"{base_url}/acts/{VIDEO_ACTOR}/runs?token={token}",
+                    json=_video_payload(hashtag, limit, options), timeout=REQUEST_TIMEOUT)
+    res.raise_for_status()
+    run = res.json()["data"]
+    run_id, dataset_id = run["id"], run["defaultDatasetId"]
+    deadline = time.monotonic() + max_wait
+
+    finished = False
+    try:
+        offset = 0
+        while True:
+            # cek status dulu, baru ambil item -> kalau sudah final, semua item pasti terambil
+            res = http.get(f"{base_url}/actor-runs/{run_id}?token={token}", timeout=REQUEST_TIMEOUT)
+            res.raise_for_status()
+            status = res.json()["data"]["status"]
+
+            while True:
+                res = http.get(
+                    f"{base_url}/datasets/{dataset_id}/items",
+                    params={"token": token, "offset": offset, "limit": page_size, "clean": "true"},
+                    timeout=REQUEST_TIMEOUT
+                )
+                res.raise_for_status()
+                items = res.json()
+                if not items:
+                    break
+
+                offset += len(items)
+                yield pd.json_normalize(items) if columns is None else project_items(items, columns)
+
+                if len(items) < page_size:
+                    break
+
+            if status in TERMINAL_STATUSES:
+                finished = True
+                if status != "SUCCEEDED":
+                    raise RuntimeError(f"Apify run {run_id} berakhir dengan status {status}")
+                return
+
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Apify run {run_id} belum selesai setelah {max_wait} detik")
+
+            time.sleep(min(poll_interval, max(0, deadline - time.monotonic())))
+    finally:
+        # timeout, error request, atau generator ditutup lebih awal -> jangan biarkan run jalan terus
+        if not finished:
+            _abort_run(http, base_url, token, run_id)
+
+def scrape_videos_async(token, hashtag, limit=50, page_size=100, poll_interval=5,
+                        session=None, base_url=APIFY_BASE_URL, columns=None, options=None,
+                        max_wait=600):
+    """
+    Versi asynchronous dari scrape_videos (start run + polling + paged dataset).
+    Returns a DataFrame.
+    """
+    pages = list(iter_video_pages(token, hashtag, limit, page_size, poll_interval,
+                                  session=session, base_url=base_url, columns=columns,
+                                  options=options, max_wait=max_wait))
+    if not pages:
+        return pd.DataFrame()
+
+    return pd.concat(pages, ignore_index=True)
+
+def scrape_videos_batch(token, hashtags, limit=50, max_workers=5, base_url=APIFY_BASE_URL, columns=None,
+                        cache=None):
+    """
+    Scrape banyak hashtag sekaligus secara paralel lewat satu session yang di-pool.
+    Returns satu DataFrame gabungan dengan kolom 'sourceHashtag'.
+    """
+    # buang hashtag kosong / duplikat tapi pertahankan urutan
+    hashtags = list(dict.fromkeys(h.strip() for h in hashtags if h and h.strip()))
+    if not hashtags:
+        return pd.DataFrame()
+
+    n_workers = max(1, min(max_workers, len(hashtags)))
+
+    with make_session(pool_size=n_workers) as session:
+        def _scrape_one(tag):
+            df = scrape_videos(token, tag, limit, session=session, base_url=base_url, columns=columns,
+                               cache=cache)
+            df["sourceHashtag"] = tag
+            return df
+
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            # map menjaga urutan hasil sesuai urutan hashtag input
+            results = list(pool.map(_scrape_one, hashtags))
+
+    results = [df for df in results if not df.empty]
+    if not results:
+        return pd.DataFrame()
+
+    return pd.concat(results, ignore_index=True)